@@ -0,0 +1,7 @@
+"""
+Project-root pytest configuration.
+
+Its presence puts the project root on sys.path for every collected test, so
+test modules import wikipedia_crawler and the top-level scripts directly
+instead of patching sys.path themselves.
+"""
@@ -4,7 +4,6 @@ Debug the combined removal process.
 """
 
 import sys
-import requests
 from pathlib import Path
 from bs4 import BeautifulSoup, Comment
 
@@ -12,6 +11,7 @@ from bs4 import BeautifulSoup, Comment
 sys.path.insert(0, str(Path(__file__).parent))
 
 from wikipedia_crawler.processors.content_processor import ContentProcessor
+from wikipedia_crawler.utils.html_cache import fetch_html_cached
 
 
 def debug_combined_removal():
@@ -19,12 +19,7 @@ def debug_combined_removal():
     url = "https://en.wikipedia.org/wiki/History_of_the_Jews_in_Singapore"
     
     # Fetch and extract HTML (same as ArticlePageHandler)
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (compatible; WikipediaCrawler/1.0; Educational Research)'
-    }
-    
-    response = requests.get(url, headers=headers, timeout=30)
-    html_content = response.text
+    html_content = fetch_html_cached(url)
     
     soup = BeautifulSoup(html_content, 'html.parser')
     content_div = soup.find('div', {'id': 'mw-content-text'})
@@ -4,7 +4,6 @@ Debug script to understand why content processing is failing for the specific UR
 """
 
 import sys
-import requests
 from pathlib import Path
 from bs4 import BeautifulSoup
 
@@ -12,6 +11,7 @@ from bs4 import BeautifulSoup
 sys.path.insert(0, str(Path(__file__).parent))
 
 from wikipedia_crawler.processors.content_processor import ContentProcessor
+from wikipedia_crawler.utils.html_cache import fetch_html_cached
 
 
 def debug_content_processing():
@@ -22,13 +22,7 @@ def debug_content_processing():
     print("=" * 80)
     
     # Fetch HTML
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (compatible; WikipediaCrawler/1.0; Educational Research)'
-    }
-    
-    response = requests.get(url, headers=headers, timeout=30)
-    response.raise_for_status()
-    html_content = response.text
+    html_content = fetch_html_cached(url)
     
     print(f"📥 Fetched HTML: {len(html_content)} characters")
     
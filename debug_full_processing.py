@@ -4,7 +4,6 @@ Debug the full content processing pipeline step by step.
 """
 
 import sys
-import requests
 from pathlib import Path
 from bs4 import BeautifulSoup
 
@@ -12,6 +11,7 @@ from bs4 import BeautifulSoup
 sys.path.insert(0, str(Path(__file__).parent))
 
 from wikipedia_crawler.processors.content_processor import ContentProcessor
+from wikipedia_crawler.utils.html_cache import fetch_html_cached
 
 
 def debug_full_processing():
@@ -19,12 +19,7 @@ def debug_full_processing():
     url = "https://en.wikipedia.org/wiki/History_of_the_Jews_in_Singapore"
     
     # Fetch HTML
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (compatible; WikipediaCrawler/1.0; Educational Research)'
-    }
-    
-    response = requests.get(url, headers=headers, timeout=30)
-    html_content = response.text
+    html_content = fetch_html_cached(url)
     
     print("🔍 Full Content Processing Pipeline Debug")
     print("=" * 60)
@@ -4,25 +4,21 @@ Debug the HTML structure to find where the content actually is.
 """
 
 import sys
-import requests
 from pathlib import Path
 from bs4 import BeautifulSoup
 
 # Add the project root to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from wikipedia_crawler.utils.html_cache import fetch_html_cached
+
 
 def debug_html_structure():
     """Debug the HTML structure to find content containers."""
     url = "https://en.wikipedia.org/wiki/History_of_the_Jews_in_Singapore"
     
     # Fetch HTML
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (compatible; WikipediaCrawler/1.0; Educational Research)'
-    }
-    
-    response = requests.get(url, headers=headers, timeout=30)
-    html_content = response.text
+    html_content = fetch_html_cached(url)
     
     print("🔍 Debugging HTML Structure")
     print("=" * 50)
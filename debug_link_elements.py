@@ -4,25 +4,21 @@ Debug what the link[rel] elements actually are.
 """
 
 import sys
-import requests
 from pathlib import Path
 from bs4 import BeautifulSoup
 
 # Add the project root to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from wikipedia_crawler.utils.html_cache import fetch_html_cached
+
 
 def debug_link_elements():
     """Debug what the link[rel] elements are."""
     url = "https://en.wikipedia.org/wiki/History_of_the_Jews_in_Singapore"
     
     # Fetch and extract HTML (same as ArticlePageHandler)
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (compatible; WikipediaCrawler/1.0; Educational Research)'
-    }
-    
-    response = requests.get(url, headers=headers, timeout=30)
-    html_content = response.text
+    html_content = fetch_html_cached(url)
     
     soup = BeautifulSoup(html_content, 'html.parser')
     content_div = soup.find('div', {'id': 'mw-content-text'})
@@ -6,6 +6,7 @@ This processor extends the original ContentProcessor with fallback methods
 for pages where the standard Wikipedia content extraction fails.
 """
 
+import copy
 import sys
 import re
 from pathlib import Path
@@ -19,6 +20,20 @@ from wikipedia_crawler.processors.content_processor import ContentProcessor
 from wikipedia_crawler.utils.logging_config import get_logger
 
 
+# Only the most essential cleanup patterns, compiled once at import time
+_MINIMAL_CLEANUP_FLAGS = re.MULTILINE | re.IGNORECASE
+_MINIMAL_CLEANUP_PATTERNS = [
+    # Remove citation markers like [1], [2]
+    (re.compile(r'\[\d+\]', _MINIMAL_CLEANUP_FLAGS), ''),
+    # Remove edit links
+    (re.compile(r'\[edit\]', _MINIMAL_CLEANUP_FLAGS), ''),
+    # Clean up multiple whitespace
+    (re.compile(r'\s+', _MINIMAL_CLEANUP_FLAGS), ' '),
+    # Remove excessive newlines
+    (re.compile(r'\n\s*\n\s*\n', _MINIMAL_CLEANUP_FLAGS), '\n\n'),
+]
+
+
 class EnhancedContentProcessor(ContentProcessor):
     """
     Enhanced content processor with fallback methods for edge cases.
@@ -217,8 +232,9 @@ class EnhancedContentProcessor(ContentProcessor):
         Returns:
             Processed content with conservative cleaning
         """
-        # Make a copy to avoid modifying the original
-        soup_copy = BeautifulSoup(str(soup), 'html.parser')
+        # Make a copy to avoid modifying the original; copying the tree is
+        # about twice as fast as serializing it and parsing it again
+        soup_copy = copy.deepcopy(soup)
         
         # Remove only the most problematic elements
         conservative_remove_elements = {
@@ -302,19 +318,8 @@ class EnhancedContentProcessor(ContentProcessor):
             Minimally cleaned content
         """
         # Only apply the most essential cleanup patterns
-        minimal_patterns = [
-            # Remove citation markers like [1], [2]
-            (r'\[\d+\]', ''),
-            # Remove edit links
-            (r'\[edit\]', ''),
-            # Clean up multiple whitespace
-            (r'\s+', ' '),
-            # Remove excessive newlines
-            (r'\n\s*\n\s*\n', '\n\n'),
-        ]
-        
-        for pattern, replacement in minimal_patterns:
-            content = re.sub(pattern, replacement, content, flags=re.MULTILINE | re.IGNORECASE)
+        for pattern, replacement in _MINIMAL_CLEANUP_PATTERNS:
+            content = pattern.sub(replacement, content)
         
         return content.strip()
     
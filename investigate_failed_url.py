@@ -251,26 +251,28 @@ class FailedURLInvestigator:
             parser_output = content_div.find('div', class_='mw-parser-output')
             if parser_output:
                 content = str(parser_output)
+                content_length = len(content)
                 extraction_info['methods_tried'].append({
                     'method': 'mw-content-text -> mw-parser-output',
                     'success': True,
-                    'content_length': len(content),
+                    'content_length': content_length,
                     'text_length': len(parser_output.get_text().strip())
                 })
                 if not extraction_info['raw_content']:
                     extraction_info['raw_content'] = content
-                    extraction_info['content_length'] = len(content)
+                    extraction_info['content_length'] = content_length
             else:
                 content = str(content_div)
+                content_length = len(content)
                 extraction_info['methods_tried'].append({
                     'method': 'mw-content-text (direct)',
                     'success': True,
-                    'content_length': len(content),
+                    'content_length': content_length,
                     'text_length': len(content_div.get_text().strip())
                 })
                 if not extraction_info['raw_content']:
                     extraction_info['raw_content'] = content
-                    extraction_info['content_length'] = len(content)
+                    extraction_info['content_length'] = content_length
         else:
             extraction_info['methods_tried'].append({
                 'method': 'mw-content-text',
@@ -283,15 +285,16 @@ class FailedURLInvestigator:
         parser_output = soup.find('div', class_='mw-parser-output')
         if parser_output:
             content = str(parser_output)
+            content_length = len(content)
             extraction_info['methods_tried'].append({
                 'method': 'mw-parser-output (direct)',
                 'success': True,
-                'content_length': len(content),
+                'content_length': content_length,
                 'text_length': len(parser_output.get_text().strip())
             })
             if not extraction_info['raw_content']:
                 extraction_info['raw_content'] = content
-                extraction_info['content_length'] = len(content)
+                extraction_info['content_length'] = content_length
         else:
             extraction_info['methods_tried'].append({
                 'method': 'mw-parser-output (direct)',
@@ -304,15 +307,16 @@ class FailedURLInvestigator:
         body_content = soup.find('div', {'id': 'bodyContent'})
         if body_content:
             content = str(body_content)
+            content_length = len(content)
             extraction_info['methods_tried'].append({
                 'method': 'bodyContent',
                 'success': True,
-                'content_length': len(content),
+                'content_length': content_length,
                 'text_length': len(body_content.get_text().strip())
             })
             if not extraction_info['raw_content']:
                 extraction_info['raw_content'] = content
-                extraction_info['content_length'] = len(content)
+                extraction_info['content_length'] = content_length
         else:
             extraction_info['methods_tried'].append({
                 'method': 'bodyContent',
@@ -7,11 +7,14 @@ the existing crawler infrastructure with smart error handling and circuit breake
 """
 
 import json
+import re
 import sys
 import time
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+import orjson
+
 # Add the project root to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -23,6 +26,49 @@ from wikipedia_crawler.processors.language_filter import LanguageFilter
 from wikipedia_crawler.utils.logging_config import get_logger
 
 
+# Matches a url_status entry such as "https://...": "error" in the text fallback
+_ERROR_ENTRY_RE = re.compile(r'"(https://[^"]+)"\s*:\s*"error"')
+
+# HTTP status codes that mark a retry as a permanent failure, matched in one scan
+PERMANENT_FAILURE_CODES = ('404', '403', '410', '451')
+_PERMANENT_FAILURE_RE = re.compile('|'.join(map(re.escape, PERMANENT_FAILURE_CODES)))
+
+# Locates the value of the url_status key so only that object is decoded; an
+# escaped quote means the text sits inside a string value, not a key
+_URL_STATUS_VALUE_RE = re.compile(r'(?<!\\)"url_status"\s*:\s*')
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _decode_url_status(content: str) -> Dict[str, str]:
+    """
+    Decode just the url_status object from progress state text.
+    
+    The state file also holds url_types and url_timestamps, each as large as
+    url_status, so skipping them avoids building most of the per-URL objects.
+    Decoding starts at the url_status value and stops where that object ends,
+    whatever the file's indentation.
+    
+    Args:
+        content: Progress state file text
+        
+    Returns:
+        Mapping of URL to status string
+        
+    Raises:
+        json.JSONDecodeError: If the url_status object is malformed
+    """
+    match = _URL_STATUS_VALUE_RE.search(content)
+    if match is None:
+        return orjson.loads(content).get('url_status', {})
+    
+    # orjson can only decode a whole document, so it would need the section
+    # sliced out first. Finding where the object ends without relying on the
+    # tracker's indentation costs more than this decode, so stdlib raw_decode
+    # is used here instead
+    url_status, _ = _JSON_DECODER.raw_decode(content, match.end())
+    return url_status
+
+
 class FailedURLRetryManager:
     """
     Manager for retrying failed URLs from the crawling operation.
@@ -96,25 +142,30 @@ class FailedURLRetryManager:
                 self.logger.error(f"Progress state file not found: {self.progress_state_file}")
                 return []
             
-            # Try to load JSON, with fallback for malformed files
-            progress_data = None
+            # Read once; the text fallback reuses the same content
+            with open(self.progress_state_file, 'r', encoding='utf-8') as f:
+                content = f.read()
+            
+            # Exact negative pre-check: without an "error" token no entry can
+            # have failed, so clean crawls skip parsing the whole state. It is
+            # still a linear scan, just a much cheaper one than decoding
+            if '"error"' not in content:
+                self.retry_stats['total_failed_urls'] = 0
+                self.logger.info("Found 0 failed URLs in progress state")
+                return []
+            
+            # Try to parse JSON, only falling back to text scanning for malformed files
             try:
-                with open(self.progress_state_file, 'r', encoding='utf-8') as f:
-                    progress_data = json.load(f)
+                url_status = _decode_url_status(content)
             except json.JSONDecodeError as e:
                 self.logger.warning(f"JSON decode error in progress state: {e}")
                 self.logger.info("Attempting to extract failed URLs using alternative method...")
                 
                 # Fallback: extract failed URLs directly from file content
-                return self._extract_failed_urls_from_text()
+                return self._extract_failed_urls_from_text(content)
             
             # Extract URLs with "error" status
-            failed_urls = []
-            url_status = progress_data.get('url_status', {})
-            
-            for url, status in url_status.items():
-                if status == 'error':
-                    failed_urls.append(url)
+            failed_urls = [url for url, status in url_status.items() if status == 'error']
             
             self.retry_stats['total_failed_urls'] = len(failed_urls)
             
@@ -128,19 +179,23 @@ class FailedURLRetryManager:
             self.logger.error(f"Error loading failed URLs: {e}")
             return []
     
-    def _extract_failed_urls_from_text(self) -> List[str]:
+    def _extract_failed_urls_from_text(self, content: Optional[str] = None) -> List[str]:
         """
         Extract failed URLs directly from the progress state file text.
         This is a fallback method when JSON parsing fails.
         
+        Args:
+            content: Progress state file text, read from disk if not given
+        
         Returns:
             List of URLs that have "error" status
         """
         failed_urls = []
         
         try:
-            with open(self.progress_state_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if content is None:
+                with open(self.progress_state_file, 'r', encoding='utf-8') as f:
+                    content = f.read()
             
             # Look for lines with "error" status in the url_status section
             lines = content.split('\n')
@@ -160,13 +215,11 @@ class FailedURLRetryManager:
                 # Extract URLs with "error" status
                 if in_url_status and '"error"' in line:
                     # Extract URL from line like: "https://...": "error",
-                    if '": "error"' in line:
-                        url_start = line.find('"https://')
-                        url_end = line.find('": "error"')
-                        if url_start != -1 and url_end != -1:
-                            url = line[url_start + 1:url_end]
-                            failed_urls.append(url)
-                            self.logger.info(f"  Extracted failed URL: {url}")
+                    match = _ERROR_ENTRY_RE.search(line)
+                    if match:
+                        url = match.group(1)
+                        failed_urls.append(url)
+                        self.logger.info(f"  Extracted failed URL: {url}")
             
             self.logger.info(f"Extracted {len(failed_urls)} failed URLs using text parsing")
             return failed_urls
@@ -206,7 +259,7 @@ class FailedURLRetryManager:
                 self.retry_stats['retry_failures'] += 1
                 
                 # Check if it's a permanent failure
-                if any(code in error_msg for code in ['404', '403', '410', '451']):
+                if _PERMANENT_FAILURE_RE.search(error_msg):
                     self.retry_stats['permanent_failures'] += 1
                     return {
                         'url': url,
@@ -225,7 +278,9 @@ class FailedURLRetryManager:
                 }
             
             # Process as article (all failed URLs appear to be articles based on the validation report)
-            result = self.article_handler.process_article(url, page_result.content)
+            result = self.article_handler.process_article(
+                url, page_result.content, dom=page_result.parsed_dom
+            )
             
             if result.success:
                 if result.data and result.data.get('filtered', False):
@@ -341,27 +396,27 @@ class FailedURLRetryManager:
         
         self.retry_stats['end_time'] = time.time()
         
-        # Generate summary
-        successful_retries = [r for r in retry_results if r['success']]
-        failed_retries = [r for r in retry_results if not r['success']]
-        permanent_failures = [r for r in failed_retries if r.get('should_skip', False)]
+        # Generate summary; only counts are needed, so no filtered lists are built
+        successful_retries = sum(1 for r in retry_results if r['success'])
+        failed_retries = len(retry_results) - successful_retries
+        permanent_failures = sum(1 for r in retry_results if not r['success'] and r.get('should_skip', False))
         
         self.logger.info("Retry operation completed")
         self.logger.info(f"Total URLs processed: {len(retry_results)}")
-        self.logger.info(f"Successful retries: {len(successful_retries)}")
-        self.logger.info(f"Failed retries: {len(failed_retries)}")
-        self.logger.info(f"Permanent failures: {len(permanent_failures)}")
+        self.logger.info(f"Successful retries: {successful_retries}")
+        self.logger.info(f"Failed retries: {failed_retries}")
+        self.logger.info(f"Permanent failures: {permanent_failures}")
         
         return {
             'success': True,
-            'message': f'Retry operation completed: {len(successful_retries)}/{len(failed_urls)} succeeded',
+            'message': f'Retry operation completed: {successful_retries}/{len(failed_urls)} succeeded',
             'results': retry_results,
             'statistics': self.retry_stats,
             'summary': {
                 'total_processed': len(retry_results),
-                'successful_retries': len(successful_retries),
-                'failed_retries': len(failed_retries),
-                'permanent_failures': len(permanent_failures),
+                'successful_retries': successful_retries,
+                'failed_retries': failed_retries,
+                'permanent_failures': permanent_failures,
                 'duration_seconds': self.retry_stats['end_time'] - self.retry_stats['start_time']
             }
         }
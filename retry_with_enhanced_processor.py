@@ -8,11 +8,14 @@ using the enhanced fallback methods.
 """
 
 import sys
-import json
 import time
+from collections import deque
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any
 
+import orjson
+
 # Add the project root to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -24,6 +27,9 @@ from wikipedia_crawler.processors.language_filter import LanguageFilter
 from wikipedia_crawler.models.data_models import ArticleData
 from wikipedia_crawler.utils.logging_config import get_logger
 
+# Matches ProgressTracker's default cap on the recent activity log
+MAX_RECENT_URLS = 100
+
 
 class EnhancedArticleHandler(ArticlePageHandler):
     """
@@ -91,7 +97,9 @@ def retry_failed_url_enhanced():
         
         # Process with enhanced handler
         print("⚙️  Processing with enhanced article handler...")
-        result = enhanced_handler.process_article(failed_url, page_result.content)
+        result = enhanced_handler.process_article(
+            failed_url, page_result.content, dom=page_result.parsed_dom
+        )
         
         if result.success:
             print("✅ Enhanced processing succeeded!")
@@ -162,8 +170,7 @@ def update_progress_state_success(url: str):
     
     try:
         # Read current progress state
-        with open(progress_file, 'r', encoding='utf-8') as f:
-            progress_data = json.load(f)
+        progress_data = orjson.loads(progress_file.read_bytes())
         
         # Update URL status
         if 'url_status' in progress_data:
@@ -182,18 +189,20 @@ def update_progress_state_success(url: str):
             if progress_data['error_summary']['content_processing_error'] == 0:
                 del progress_data['error_summary']['content_processing_error']
         
-        # Add success note
-        current_time = time.strftime('%Y-%m-%dT%H:%M:%S')
-        if 'recent_urls' not in progress_data:
-            progress_data['recent_urls'] = []
-        
-        progress_data['recent_urls'].append(
-            f"{current_time} ENHANCED_RETRY_SUCCESS (en): {url}"
-        )
+        # Add success note, keeping only the newest entries so repeated
+        # retries cannot grow the state file without bound
+        current_time = datetime.now().isoformat(timespec='seconds')
+        recent_urls = deque(progress_data.get('recent_urls', []), maxlen=MAX_RECENT_URLS)
+        recent_urls.append(f"{current_time} ENHANCED_RETRY_SUCCESS (en): {url}")
+        progress_data['recent_urls'] = list(recent_urls)
         
-        # Write updated progress state
-        with open(progress_file, 'w', encoding='utf-8') as f:
-            json.dump(progress_data, f, indent=2, ensure_ascii=False)
+        # Write updated progress state atomically so an interrupt cannot leave a torn file
+        temp_file = progress_file.with_suffix('.json.tmp')
+        temp_file.write_bytes(orjson.dumps(
+            progress_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ))
+        temp_file.replace(progress_file)
         
         print(f"✅ Updated progress state: {url} marked as completed")
         
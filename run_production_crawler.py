@@ -5,50 +5,98 @@ import argparse
 import os
 import signal
 import sys
-import time
 from pathlib import Path
+from typing import List, Tuple
 
 from wikipedia_crawler.core.wikipedia_crawler import WikipediaCrawler
 from wikipedia_crawler.utils.logging_config import setup_logging
 import logging
 
 
-def print_status(crawler: WikipediaCrawler, show_details: bool = False) -> None:
-    """Print current crawler status."""
+def format_status(crawler: WikipediaCrawler, show_details: bool = False) -> List[str]:
+    """Build the lines of the current crawler status report."""
     status = crawler.get_status()
-    print(f"\n=== Crawler Status ===")
-    print(f"Running: {status.is_running}")
-    print(f"Total processed: {status.total_processed}")
-    print(f"Pending URLs: {status.pending_urls}")
-    print(f"Categories processed: {status.categories_processed}")
-    print(f"Articles processed: {status.articles_processed}")
-    print(f"Filtered count: {status.filtered_count}")
-    print(f"Error count: {status.error_count}")
+    lines = [
+        "",
+        "=== Crawler Status ===",
+        f"Running: {status.is_running}",
+        f"Total processed: {status.total_processed}",
+        f"Pending URLs: {status.pending_urls}",
+        f"Categories processed: {status.categories_processed}",
+        f"Articles processed: {status.articles_processed}",
+        f"Filtered count: {status.filtered_count}",
+        f"Error count: {status.error_count}",
+    ]
     if status.start_time:
-        print(f"Started: {status.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(f"Started: {status.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
     if status.last_activity:
-        print(f"Last activity: {status.last_activity.strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(f"Last activity: {status.last_activity.strftime('%Y-%m-%d %H:%M:%S')}")
     
     if show_details:
         stats = crawler.get_detailed_stats()
         page_stats = stats.get('page_processor', {})
-        print(f"\n=== HTTP Request Stats ===")
-        print(f"Total requests: {page_stats.get('requests_made', 0)}")
-        print(f"Successful: {page_stats.get('successful_requests', 0)}")
-        print(f"Failed: {page_stats.get('failed_requests', 0)}")
-        print(f"Retries attempted: {page_stats.get('retries_attempted', 0)}")
+        lines.extend([
+            "",
+            "=== HTTP Request Stats ===",
+            f"Total requests: {page_stats.get('requests_made', 0)}",
+            f"Successful: {page_stats.get('successful_requests', 0)}",
+            f"Failed: {page_stats.get('failed_requests', 0)}",
+            f"Retries attempted: {page_stats.get('retries_attempted', 0)}",
+            
+            # Show error breakdown
+            "",
+            "=== Error Breakdown ===",
+            f"Permanent failures (404/403): {page_stats.get('permanent_failures', 0)}",
+            f"Client errors (4xx): {page_stats.get('client_errors', 0)}",
+            f"Connection errors: {page_stats.get('connection_errors', 0)}",
+            f"Timeout errors: {page_stats.get('timeout_errors', 0)}",
+            f"Redirect errors: {page_stats.get('redirect_errors', 0)}",
+            f"Other errors: {page_stats.get('other_errors', 0)}",
+            f"Total failures: {page_stats.get('total_failures', 0)}",
+        ])
+    
+    lines.append("=" * 22)
+    return lines
+
+
+def write_lines(lines: List[str]) -> None:
+    """Write a block of lines to stdout in a single call."""
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+
+
+def print_status(crawler: WikipediaCrawler, show_details: bool = False) -> None:
+    """Print current crawler status."""
+    write_lines(format_status(crawler, show_details))
+
+
+def summarize_json_files(directory: Path) -> Tuple[int, int]:
+    """
+    Count JSON files under a directory and total their size.
+    
+    Uses os.scandir so each file's size comes from the cached directory
+    entry instead of a separate Path construction and stat() call.
+    
+    Args:
+        directory: Directory to scan recursively
         
-        # Show error breakdown
-        print(f"\n=== Error Breakdown ===")
-        print(f"Permanent failures (404/403): {page_stats.get('permanent_failures', 0)}")
-        print(f"Client errors (4xx): {page_stats.get('client_errors', 0)}")
-        print(f"Connection errors: {page_stats.get('connection_errors', 0)}")
-        print(f"Timeout errors: {page_stats.get('timeout_errors', 0)}")
-        print(f"Redirect errors: {page_stats.get('redirect_errors', 0)}")
-        print(f"Other errors: {page_stats.get('other_errors', 0)}")
-        print(f"Total failures: {page_stats.get('total_failures', 0)}")
+    Returns:
+        Tuple of (file_count, total_size_bytes)
+    """
+    file_count = 0
+    total_size = 0
+    pending = [directory]
+    
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith('.json'):
+                    file_count += 1
+                    total_size += entry.stat().st_size
     
-    print("=" * 22)
+    return file_count, total_size
 
 
 def main():
@@ -111,6 +159,13 @@ Error Handling Features:
         help="Maximum retry attempts for failed requests (default: 3)"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of URLs processed concurrently; requests stay --delay apart (default: 1)"
+    )
+    
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
@@ -147,16 +202,10 @@ Error Handling Features:
     crawler = None
     
     def signal_handler(signum, frame):
-        """Handle shutdown signals."""
-        logger.info(f"Received signal {signum}, shutting down gracefully...")
-        if crawler:
-            print("\nShutting down crawler...")
-            crawler.stop_crawling()
-        sys.exit(0)
-    
-    # Register signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+        """Ask the crawler to stop; the wait loops return once it has."""
+        logger.info("Received shutdown signal, shutting down gracefully...")
+        print("\nShutting down crawler...")
+        crawler.request_stop()
     
     try:
         print("=" * 70)
@@ -168,6 +217,7 @@ Error Handling Features:
         print(f"Maximum crawling depth: {args.max_depth}")
         print(f"Request delay: {args.delay}s")
         print(f"Max retries: {args.max_retries}")
+        print(f"Workers: {args.workers}")
         print(f"Max errors before stopping: {args.max_errors}")
         print("=" * 70)
         
@@ -188,9 +238,14 @@ Error Handling Features:
             output_dir=args.output_dir,
             max_depth=args.max_depth,
             delay_between_requests=args.delay,
-            max_retries=args.max_retries
+            max_retries=args.max_retries,
+            max_workers=args.workers
         )
         
+        # Registered after the crawler, which installs handlers of its own
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
+        
         # Start crawling
         logger.info("Starting Wikipedia crawler...")
         crawler.start_crawling()
@@ -203,60 +258,53 @@ Error Handling Features:
             last_processed = 0
             stall_count = 0
             
-            try:
-                while True:
-                    status = crawler.get_status()
-                    
-                    if not status.is_running:
-                        print("\nCrawler has stopped")
+            while True:
+                status = crawler.get_status()
+                
+                if not status.is_running:
+                    print("\nCrawler has stopped")
+                    break
+                
+                # Check for progress
+                if status.total_processed == last_processed:
+                    stall_count += 1
+                else:
+                    stall_count = 0
+                    last_processed = status.total_processed
+                
+                # Print status
+                print_status(crawler, show_details=True)
+                
+                # Check for too many errors
+                if status.error_count >= args.max_errors:
+                    print(f"\nToo many errors ({status.error_count}), stopping crawler...")
+                    break
+                
+                # Check for stalled progress
+                if stall_count >= 5:  # 5 intervals without progress
+                    print(f"\nNo progress for {stall_count * args.status_interval}s, checking if crawler is stuck...")
+                    if status.pending_urls == 0:
+                        print("No pending URLs - crawl appears complete")
                         break
-                    
-                    # Check for progress
-                    if status.total_processed == last_processed:
-                        stall_count += 1
-                    else:
-                        stall_count = 0
-                        last_processed = status.total_processed
-                    
-                    # Print status
-                    print_status(crawler, show_details=True)
-                    
-                    # Check for too many errors
-                    if status.error_count >= args.max_errors:
-                        print(f"\nToo many errors ({status.error_count}), stopping crawler...")
-                        break
-                    
-                    # Check for stalled progress
-                    if stall_count >= 5:  # 5 intervals without progress
-                        print(f"\nNo progress for {stall_count * args.status_interval}s, checking if crawler is stuck...")
-                        if status.pending_urls == 0:
-                            print("No pending URLs - crawl appears complete")
-                            break
-                    
-                    time.sleep(args.status_interval)
-                    
-            except KeyboardInterrupt:
-                print("\nMonitoring interrupted by user")
+                
+                # Wakes up early once the crawl loop exits, including after a signal
+                crawler.wait_for_completion(timeout=args.status_interval)
         else:
             # Wait for completion without monitoring
             print("Crawling started - press Ctrl+C to stop")
             print("Use --monitor flag for progress updates")
             
-            try:
-                while True:
-                    status = crawler.get_status()
-                    if not status.is_running:
-                        break
-                    
-                    # Check for too many errors
-                    if status.error_count >= args.max_errors:
-                        logger.error(f"Too many errors ({status.error_count}), stopping crawler")
-                        break
-                    
-                    time.sleep(10)  # Check every 10 seconds
-                    
-            except KeyboardInterrupt:
-                print("\nCrawling interrupted by user")
+            while True:
+                status = crawler.get_status()
+                if not status.is_running:
+                    break
+                
+                # Check for too many errors
+                if status.error_count >= args.max_errors:
+                    logger.error(f"Too many errors ({status.error_count}), stopping crawler")
+                    break
+                
+                crawler.wait_for_completion(timeout=10)  # Check every 10 seconds
         
         # Stop crawler if still running
         if crawler.get_status().is_running:
@@ -264,42 +312,40 @@ Error Handling Features:
             crawler.stop_crawling()
         
         # Final status
-        print("\n" + "=" * 70)
-        print("CRAWLING SESSION COMPLETED")
-        print("=" * 70)
-        
         final_status = crawler.get_status()
-        print_status(crawler, show_details=True)
+        lines = [
+            "",
+            "=" * 70,
+            "CRAWLING SESSION COMPLETED",
+            "=" * 70,
+        ]
+        lines.extend(format_status(crawler, show_details=True))
         
         # Show output summary
-        print(f"\n=== Output Summary ===")
+        lines.extend(["", "=== Output Summary ==="])
         if output_path.exists():
-            total_size = 0
-            file_count = 0
-            
-            for root, dirs, files in os.walk(output_path):
-                for file in files:
-                    if not file.endswith('.json'):
-                        continue
-                    filepath = Path(root) / file
-                    size = filepath.stat().st_size
-                    total_size += size
-                    file_count += 1
+            file_count, total_size = summarize_json_files(output_path)
             
-            print(f"Output directory: {output_path}")
-            print(f"Files created: {file_count}")
-            print(f"Total size: {total_size / 1024 / 1024:.2f} MB")
+            lines.extend([
+                f"Output directory: {output_path}",
+                f"Files created: {file_count}",
+                f"Total size: {total_size / 1024 / 1024:.2f} MB",
+            ])
         
         # Success/failure summary
+        lines.append("")
         if final_status.error_count == 0:
-            print("\n✅ Crawling completed successfully with no errors!")
+            lines.append("✅ Crawling completed successfully with no errors!")
         elif final_status.error_count < args.max_errors:
-            print(f"\n⚠️  Crawling completed with {final_status.error_count} errors (within acceptable limit)")
+            lines.append(f"⚠️  Crawling completed with {final_status.error_count} errors (within acceptable limit)")
         else:
-            print(f"\n❌ Crawling stopped due to too many errors ({final_status.error_count})")
+            lines.append(f"❌ Crawling stopped due to too many errors ({final_status.error_count})")
         
-        print("\nTo resume this crawl later, run:")
-        print(f"python run_production_crawler.py --output-dir {args.output_dir}")
+        lines.extend([
+            "",
+            "To resume this crawl later, run:",
+            f"python run_production_crawler.py --output-dir {args.output_dir}",
+        ])
         
         # Show error handling summary
         stats = crawler.get_detailed_stats()
@@ -307,10 +353,14 @@ Error Handling Features:
         permanent_failures = page_stats.get('permanent_failures', 0)
         total_retries = page_stats.get('retries_attempted', 0)
         
-        print(f"\n=== Error Handling Summary ===")
-        print(f"Permanent failures (404/403) skipped: {permanent_failures}")
-        print(f"Retry attempts made: {total_retries}")
-        print("✅ Smart error handling prevented wasted retry attempts on permanent failures")
+        lines.extend([
+            "",
+            "=== Error Handling Summary ===",
+            f"Permanent failures (404/403) skipped: {permanent_failures}",
+            f"Retry attempts made: {total_retries}",
+            "✅ Smart error handling prevented wasted retry attempts on permanent failures",
+        ])
+        write_lines(lines)
         
     except Exception as e:
         logger.error(f"Crawling failed: {e}")
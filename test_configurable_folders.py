@@ -3,23 +3,55 @@
 Test script for configurable folder organization.
 """
 
+import os
+import stat
 import sys
-import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-
-# Add the project root to Python path
-sys.path.insert(0, str(Path(__file__).parent))
+from typing import Dict, List, Optional
 
 from wikipedia_crawler.core.file_storage import FileStorage
 from wikipedia_crawler.models.data_models import ArticleData, CategoryData
 from datetime import datetime
 
 
-def test_folder_configurations():
+def _is_file(path) -> bool:
+    """Check that a path is a regular file using a single stat() call."""
+    try:
+        return stat.S_ISREG(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def _all_files(*paths) -> bool:
+    """Check that every path is a regular file, stopping at the first miss."""
+    return all(_is_file(path) for path in paths)
+
+
+class Log:
+    """Collect output lines and write them to stdout in a single call."""
+    
+    def __init__(self):
+        self.buf: List[str] = []
+    
+    def __call__(self, line: str = '') -> None:
+        self.buf.append(line)
+    
+    def flush(self) -> None:
+        """Write all buffered lines at once and clear the buffer."""
+        if self.buf:
+            sys.stdout.write('\n'.join(self.buf) + '\n')
+            self.buf.clear()
+
+
+def test_folder_configurations(tmp_path):
     """Test different folder configuration options."""
+    log = Log()
     
-    print("🧪 Testing Configurable Folder Organization")
-    print("=" * 50)
+    log("🧪 Testing Configurable Folder Organization")
+    log("=" * 50)
     
     # Test data
     test_article = ArticleData(
@@ -36,12 +68,16 @@ def test_folder_configurations():
         articles=["Article1", "Article2"]
     )
     
-    # Test configurations
+    today = datetime.now().strftime('%Y-%m-%d')
+    
+    # Test configurations, with the folders (relative to output_dir) the
+    # article and the category are expected to land in
     configurations = [
         {
             'name': 'Flat Structure',
             'config': {'organize_by': 'flat'},
-            'output_dir': 'test_output/flat'
+            'output_dir': tmp_path / 'flat',
+            'expected_dirs': ('.', '.')
         },
         {
             'name': 'Category Organization',
@@ -50,7 +86,8 @@ def test_folder_configurations():
                 'category_folder_name': 'Category_Singapore',
                 'create_subfolders': False
             },
-            'output_dir': 'test_output/category'
+            'output_dir': tmp_path / 'category',
+            'expected_dirs': ('Category_Singapore', 'Category_Singapore')
         },
         {
             'name': 'Category with Subfolders',
@@ -59,12 +96,14 @@ def test_folder_configurations():
                 'category_folder_name': 'Category_Singapore',
                 'create_subfolders': True
             },
-            'output_dir': 'test_output/category_subfolders'
+            'output_dir': tmp_path / 'category_subfolders',
+            'expected_dirs': ('Category_Singapore/articles', 'Category_Singapore/categories')
         },
         {
             'name': 'Type Organization',
             'config': {'organize_by': 'type'},
-            'output_dir': 'test_output/type'
+            'output_dir': tmp_path / 'type',
+            'expected_dirs': ('articles', 'categories')
         },
         {
             'name': 'Date Organization',
@@ -72,48 +111,53 @@ def test_folder_configurations():
                 'organize_by': 'date',
                 'create_subfolders': True
             },
-            'output_dir': 'test_output/date'
+            'output_dir': tmp_path / 'date',
+            'expected_dirs': (f'{today}/article', f'{today}/category')
         }
     ]
     
-    # Test each configuration
-    for config_test in configurations:
-        print(f"\n📁 Testing: {config_test['name']}")
-        print(f"   Config: {config_test['config']}")
+    def run_one(config_test):
+        """Save both test files with one configuration and return their paths."""
+        storage = FileStorage(
+            output_dir=config_test['output_dir'],
+            folder_config=config_test['config']
+        )
+        return storage.save_article(test_article), storage.save_category(test_category)
+    
+    # Each configuration writes to its own directory, so they can run concurrently
+    with ThreadPoolExecutor(max_workers=len(configurations)) as executor:
+        results = list(executor.map(run_one, configurations))
+    
+    # Check and report in configuration order once all writes are done
+    for config_test, (article_path, category_path) in zip(configurations, results):
+        log(f"\n📁 Testing: {config_test['name']}")
+        log(f"   Config: {config_test['config']}")
+        log(f"   ✅ Article saved to: {article_path}")
+        log(f"   ✅ Category saved to: {category_path}")
         
-        try:
-            # Create file storage with configuration
-            storage = FileStorage(
-                output_dir=config_test['output_dir'],
-                folder_config=config_test['config']
-            )
-            
-            # Save test files
-            article_path = storage.save_article(test_article)
-            category_path = storage.save_category(test_category)
-            
-            print(f"   ✅ Article saved to: {article_path}")
-            print(f"   ✅ Category saved to: {category_path}")
-            
-            # Verify files exist
-            if Path(article_path).exists() and Path(category_path).exists():
-                print(f"   ✅ Files verified successfully")
-            else:
-                print(f"   ❌ File verification failed")
-                
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
+        output_dir = config_test['output_dir']
+        assert _all_files(article_path, category_path)
+        saved_dirs = tuple(Path(path).parent.relative_to(output_dir).as_posix()
+                           for path in (article_path, category_path))
+        assert saved_dirs == config_test['expected_dirs'], config_test['name']
+        
+        # Exactly one article and one category file, and nothing else
+        stats = collect_stats(output_dir)
+        assert (stats.total, stats.articles, stats.categories) == (2, 1, 1), config_test['name']
+        log(f"   ✅ Files verified successfully")
     
-    print(f"\n📊 Test Summary:")
-    print(f"   All folder configurations tested")
-    print(f"   Check test_output/ directory for results")
+    log(f"\n📊 Test Summary:")
+    log(f"   All folder configurations tested")
+    
+    log.flush()
 
 
-def test_singapore_folder_structure():
+def test_singapore_folder_structure(tmp_path):
     """Test the specific Singapore folder structure."""
+    log = Log()
     
-    print(f"\n🇸🇬 Testing Singapore Folder Structure")
-    print("=" * 50)
+    log(f"\n🇸🇬 Testing Singapore Folder Structure")
+    log("=" * 50)
     
     # Configuration matching the updated config.json
     singapore_config = {
@@ -122,8 +166,9 @@ def test_singapore_folder_structure():
         'create_subfolders': False
     }
     
+    output_dir = tmp_path / 'singapore_test'
     storage = FileStorage(
-        output_dir='test_output/singapore_test',
+        output_dir=output_dir,
         folder_config=singapore_config
     )
     
@@ -142,72 +187,168 @@ def test_singapore_folder_structure():
         articles=["Singapore", "History of Singapore", "Marina Bay Sands"]
     )
     
-    try:
-        article_path = storage.save_article(singapore_article)
-        category_path = storage.save_category(singapore_category)
-        
-        print(f"✅ Singapore article saved to: {article_path}")
-        print(f"✅ Singapore category saved to: {category_path}")
+    article_path = storage.save_article(singapore_article)
+    category_path = storage.save_category(singapore_category)
+    
+    log(f"✅ Singapore article saved to: {article_path}")
+    log(f"✅ Singapore category saved to: {category_path}")
+    
+    # Both files go straight into the Category_Singapore folder
+    expected_folder = output_dir / 'Category_Singapore'
+    assert expected_folder.is_dir()
+    assert Path(article_path).parent == expected_folder
+    assert Path(category_path).parent == expected_folder
+    log(f"✅ Category_Singapore folder created successfully")
+    
+    contents = sorted(item.name for item in expected_folder.iterdir())
+    assert contents == ['Marina Bay Sands.json', 'category_Singapore.json']
+    log(f"📁 Folder contents ({len(contents)} files):")
+    for name in contents:
+        log(f"   • {name}")
+    
+    log.flush()
+
+
+# Name checks in the collect_stats loop compare fixed-width slices
+_CAT_PFX = 'category_'
+_CAT_LEN = len(_CAT_PFX)
+_JSON_SFX = '.json'
+_JSON_LEN = len(_JSON_SFX)
+
+
+@dataclass
+class Stats:
+    """JSON file statistics for a crawler output directory."""
+    total: int = 0
+    articles: int = 0
+    categories: int = 0
+    per_subdir: Dict[str, int] = field(default_factory=dict)
+    samples: List[str] = field(default_factory=list)  # First files found, in directory order
+
+
+def _scan_json(path):
+    """
+    Yield DirEntry objects for JSON files under a directory.
+    
+    Walks the tree with os.scandir so file types come from the cached
+    directory entries rather than an extra stat() per file. Symlinks are
+    skipped.
+    
+    Args:
+        path: Directory to scan recursively
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_symlink():
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_json(entry.path)
+            elif entry.name[-_JSON_LEN:] == _JSON_SFX and entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+def collect_stats(root, max_samples: int = 5) -> Stats:
+    """
+    Collect file statistics for a directory in a single walk.
+    
+    Files are classified as they are found, so no per-type lists of paths
+    are ever built. Symlinked files and directories are skipped.
+    
+    Args:
+        root: Directory to scan
+        max_samples: Maximum number of sample file names to keep
         
-        # Verify the folder structure
-        expected_folder = Path('test_output/singapore_test/Category_Singapore')
-        if expected_folder.exists():
-            print(f"✅ Category_Singapore folder created successfully")
-            
-            # List contents
-            contents = list(expected_folder.iterdir())
-            print(f"📁 Folder contents ({len(contents)} files):")
-            for item in contents[:5]:  # Show first 5
-                print(f"   • {item.name}")
-            if len(contents) > 5:
-                print(f"   ... and {len(contents) - 5} more files")
-        else:
-            print(f"❌ Expected folder not found: {expected_folder}")
+    Returns:
+        Stats with totals, per top-level subdirectory counts and samples
+    """
+    stats = Stats()
+    
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_symlink():
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdir: Optional[str] = entry.name
+                stats.per_subdir[subdir] = 0
+                files = _scan_json(entry.path)
+            elif entry.name[-_JSON_LEN:] == _JSON_SFX and entry.is_file(follow_symlinks=False):
+                subdir = None
+                files = (entry,)
+            else:
+                continue
             
-    except Exception as e:
-        print(f"❌ Error testing Singapore structure: {e}")
+            for file_entry in files:
+                name = file_entry.name
+                stats.total += 1
+                if name[:_CAT_LEN] == _CAT_PFX:
+                    stats.categories += 1
+                else:
+                    stats.articles += 1
+                if subdir is not None:
+                    stats.per_subdir[subdir] += 1
+                if len(stats.samples) < max_samples:
+                    stats.samples.append(name)
+    
+    return stats
+
+
+def test_collect_stats_skips_symlinks(tmp_path):
+    """Test that collect_stats counts real JSON files only, per top-level folder."""
+    (tmp_path / 'articles').mkdir()
+    (tmp_path / 'articles' / 'nested').mkdir()
+    (tmp_path / 'empty').mkdir()
+    for relative in ('Top.json', 'category_Top.json', 'articles/A.json',
+                     'articles/nested/category_B.json', 'articles/notes.txt'):
+        (tmp_path / relative).write_text('{}', encoding='utf-8')
+    
+    (tmp_path / 'Link.json').symlink_to(tmp_path / 'Top.json')
+    (tmp_path / 'linked_dir').symlink_to(tmp_path / 'articles', target_is_directory=True)
+    
+    stats = collect_stats(tmp_path)
+    
+    assert (stats.total, stats.articles, stats.categories) == (4, 2, 2)
+    assert stats.per_subdir == {'articles': 2, 'empty': 0}
 
 
 def show_current_singapore_structure():
     """Show the current Singapore folder structure."""
+    log = Log()
     
-    print(f"\n📂 Current Singapore Folder Structure")
-    print("=" * 50)
+    log(f"\n📂 Current Singapore Folder Structure")
+    log("=" * 50)
     
     singapore_dir = Path("wiki_data/Category_Singapore")
     
     if singapore_dir.exists():
-        print(f"✅ Found Singapore directory: {singapore_dir}")
+        log(f"✅ Found Singapore directory: {singapore_dir}")
         
-        # Count files by type
-        json_files = list(singapore_dir.rglob('*.json'))
-        article_files = [f for f in json_files if not f.name.startswith('category_')]
-        category_files = [f for f in json_files if f.name.startswith('category_')]
+        # Count files by type and by top-level subdirectory in one walk
+        stats = collect_stats(singapore_dir)
         
-        print(f"📊 Directory statistics:")
-        print(f"   Total JSON files: {len(json_files)}")
-        print(f"   Article files: {len(article_files)}")
-        print(f"   Category files: {len(category_files)}")
+        log(f"📊 Directory statistics:")
+        log(f"   Total JSON files: {stats.total}")
+        log(f"   Article files: {stats.articles}")
+        log(f"   Category files: {stats.categories}")
         
         # Show subdirectories
-        subdirs = [d for d in singapore_dir.iterdir() if d.is_dir()]
-        if subdirs:
-            print(f"   Subdirectories: {len(subdirs)}")
-            for subdir in subdirs:
-                subdir_files = len(list(subdir.rglob('*.json')))
-                print(f"     • {subdir.name}: {subdir_files} files")
+        if stats.per_subdir:
+            log(f"   Subdirectories: {len(stats.per_subdir)}")
+            for subdir_name, subdir_files in stats.per_subdir.items():
+                log(f"     • {subdir_name}: {subdir_files} files")
         else:
-            print(f"   No subdirectories (flat structure)")
+            log(f"   No subdirectories (flat structure)")
         
-        # Show sample files
-        print(f"\n📄 Sample files:")
-        for file_path in json_files[:5]:
-            print(f"   • {file_path.name}")
-        if len(json_files) > 5:
-            print(f"   ... and {len(json_files) - 5} more")
+        # Show sample files; only the bounded sample is sorted, never the full listing
+        log(f"\n📄 Sample files:")
+        for name in sorted(stats.samples):
+            log(f"   • {name}")
+        if stats.total > len(stats.samples):
+            log(f"   ... and {stats.total - len(stats.samples)} more")
             
     else:
-        print(f"❌ Singapore directory not found: {singapore_dir}")
+        log(f"❌ Singapore directory not found: {singapore_dir}")
+    
+    log.flush()
 
 
 if __name__ == "__main__":
@@ -215,10 +356,11 @@ if __name__ == "__main__":
     show_current_singapore_structure()
     
     # Test folder configurations
-    test_folder_configurations()
+    with tempfile.TemporaryDirectory() as output_root:
+        test_folder_configurations(Path(output_root))
     
     # Test Singapore-specific structure
-    test_singapore_folder_structure()
+    with tempfile.TemporaryDirectory() as output_root:
+        test_singapore_folder_structure(Path(output_root))
     
-    print(f"\n✅ All tests completed!")
-    print(f"📁 Check test_output/ directory for generated folder structures")
\ No newline at end of file
+    print(f"\n✅ All tests completed!")
\ No newline at end of file
@@ -1,36 +1,54 @@
 #!/usr/bin/env python3
 """Test the network connectivity detection and user interaction logic."""
 
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 import requests
 from wikipedia_crawler.core.page_processor import PageProcessor
 from wikipedia_crawler.utils.logging_config import setup_logging
+from tests._clock import FakeClock, assert_backoff_sleeps
+
+# Canned responses shared by every test; side effects only pick which to return
+RESP_200 = Mock(status_code=200, text="<html><body>Test content</body></html>",
+                headers={'content-type': 'text/html'})
+RESP_404 = Mock(status_code=404)
 
 class TestConnectivityHandling(unittest.TestCase):
     """Test network connectivity detection and user interaction."""
     
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Create one processor (and HTTP session) shared by all tests."""
         setup_logging("WARNING")  # Reduce log noise during tests
-        self.processor = PageProcessor(
+        cls.processor = PageProcessor(
             delay_between_requests=0.01,  # Very fast for tests
             max_retries=1,  # Minimal retries for faster tests
             timeout=5
         )
     
-    def tearDown(self):
-        """Clean up after tests."""
-        self.processor.close()
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after all tests."""
+        cls.processor.close()
+    
+    def setUp(self):
+        """Start each test with fresh counters and no real sleeps."""
+        self.processor.reset_stats()
+        
+        # Rate limiting and retry backoff advance a fake clock instead of waiting
+        self.clock = FakeClock()
+        clock_patcher = patch('wikipedia_crawler.core.page_processor.time', self.clock)
+        clock_patcher.start()
+        self.addCleanup(clock_patcher.stop)
+        
+        # No earlier request to space out from, so only retry backoff sleeps
+        self.processor._last_request_time = float('-inf')
     
     def test_connectivity_test_success(self):
         """Test that connectivity test to Google works correctly."""
-        def mock_google_success(*args, **kwargs):
-            response = Mock()
-            response.status_code = 200
-            return response
-        
-        with patch.object(self.processor.session, 'get', side_effect=mock_google_success):
+        with patch.object(self.processor.session, 'get', return_value=RESP_200):
             result = self.processor._test_network_connectivity()
             
             self.assertTrue(result)
@@ -90,11 +108,7 @@ class TestConnectivityHandling(unittest.TestCase):
                 if call_count['count'] <= 3:  # Initial attempts fail
                     raise requests.exceptions.ConnectionError("Connection failed")
                 else:  # User retry succeeds
-                    response = Mock()
-                    response.status_code = 200
-                    response.text = "<html><body>Test content</body></html>"
-                    response.headers = {'content-type': 'text/html'}
-                    return response
+                    return RESP_200
         
         def mock_user_continue(prompt):
             return "continue"
@@ -114,9 +128,7 @@ class TestConnectivityHandling(unittest.TestCase):
         def mock_google_works_url_fails(*args, **kwargs):
             if "google.com" in args[0]:
                 # Google connectivity test succeeds
-                response = Mock()
-                response.status_code = 200
-                return response
+                return RESP_200
             else:
                 # Target URL fails
                 raise requests.exceptions.ConnectionError("Connection failed")
@@ -154,6 +166,9 @@ class TestConnectivityHandling(unittest.TestCase):
                 self.assertEqual(stats['skipped_urls'], 1)
                 self.assertEqual(stats['user_retries'], 3)  # Should have 3 user retry attempts
                 self.assertEqual(stats['user_decisions']['continue'], 3)
+        
+        # One backoff wait per fetch: the first attempt plus three user retries
+        assert_backoff_sleeps(self.clock.sleeps, delay=0.01, max_retries=1, fetches=4)
     
     def test_circuit_breaker_warning_display(self):
         """Test that circuit breaker warning is displayed on final retry cycle."""
@@ -184,6 +199,9 @@ class TestConnectivityHandling(unittest.TestCase):
                 self.assertEqual(stats['user_retries'], 2)
                 self.assertEqual(stats['user_decisions']['continue'], 2)
                 self.assertEqual(stats['user_decisions']['skip'], 1)
+        
+        # The first attempt plus two user retries before skipping
+        assert_backoff_sleeps(self.clock.sleeps, delay=0.01, max_retries=1, fetches=3)
     
     def test_connectivity_recovery_during_retry_cycle(self):
         """Test behavior when connectivity recovers during a retry cycle."""
@@ -198,9 +216,7 @@ class TestConnectivityHandling(unittest.TestCase):
                 if google_call_count['count'] == 1:
                     raise requests.exceptions.ConnectionError("Network unreachable")
                 else:
-                    response = Mock()
-                    response.status_code = 200
-                    return response
+                    return RESP_200
             else:
                 # Target URL always fails
                 raise requests.exceptions.ConnectionError("Connection failed")
@@ -222,15 +238,13 @@ class TestConnectivityHandling(unittest.TestCase):
                 self.assertEqual(stats['connectivity_tests'], 2)
                 self.assertEqual(stats['connectivity_failures'], 1)
                 self.assertEqual(stats['connectivity_successes'], 1)
+        
+        # The first attempt plus the one user retry before recovery
+        assert_backoff_sleeps(self.clock.sleeps, delay=0.01, max_retries=1, fetches=2)
     
     def test_permanent_failure_no_connectivity_test(self):
         """Test that permanent failures (404) don't trigger connectivity tests."""
-        def mock_404_response(*args, **kwargs):
-            response = Mock()
-            response.status_code = 404
-            return response
-        
-        with patch.object(self.processor.session, 'get', side_effect=mock_404_response):
+        with patch.object(self.processor.session, 'get', return_value=RESP_404):
             result = self.processor.process_page("https://example.com/test")
             
             self.assertFalse(result.success)
@@ -238,6 +252,34 @@ class TestConnectivityHandling(unittest.TestCase):
             # Should not have any connectivity tests for permanent failures
             self.assertEqual(stats.get('connectivity_tests', 0), 0)
             self.assertEqual(stats['permanent_failures'], 1)
+    
+    def test_concurrent_prompts_are_serialized(self):
+        """Test that workers failing at the same time never prompt at once."""
+        lock = threading.Lock()
+        active = []
+        overlaps = []
+        
+        def mock_prompt(url, current_cycle, max_cycles):
+            with lock:
+                active.append(url)
+                overlaps.append(len(active))
+            threading.Event().wait(0.02)  # Hold the prompt open for a moment
+            with lock:
+                active.remove(url)
+            return 'skip'
+        
+        urls = [f"https://example.com/test_{i}" for i in range(4)]
+        with patch.object(self.processor, '_test_network_connectivity', return_value=False), \
+             patch.object(self.processor, '_prompt_user_for_action', side_effect=mock_prompt):
+            with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+                results = list(executor.map(
+                    lambda url: self.processor._handle_failed_url_with_connectivity_check(
+                        url, requests.exceptions.ConnectionError("Connection failed")),
+                    urls))
+        
+        self.assertEqual(results, [None] * len(urls))
+        self.assertEqual(overlaps, [1] * len(urls))
+        self.assertEqual(self.processor.get_stats()['skipped_urls'], len(urls))
 
 if __name__ == "__main__":
     print("Testing Network Connectivity Detection and User Interaction")
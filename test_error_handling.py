@@ -6,68 +6,69 @@ from unittest.mock import Mock, patch
 import requests
 from wikipedia_crawler.core.page_processor import PageProcessor
 from wikipedia_crawler.utils.logging_config import setup_logging
+from tests._clock import FakeClock, assert_backoff_sleeps
+
+# Canned responses shared by every test instead of building a Mock per request
+RESP_200 = Mock(status_code=200, text="<html><body><h1>Test Page</h1></body></html>",
+                headers={'content-type': 'text/html'})
+RESP_500 = Mock(status_code=500)
+PERMANENT_FAILURE_RESPONSES = {status: Mock(status_code=status) for status in (403, 404, 410, 451)}
 
 class TestErrorHandling(unittest.TestCase):
     """Test error handling in the page processor."""
     
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Create one processor (and HTTP session) shared by all tests."""
         setup_logging("WARNING")  # Reduce log noise during tests
-        self.processor = PageProcessor(
+        cls.processor = PageProcessor(
             delay_between_requests=0.01,  # Very fast for tests
             max_retries=2,
             timeout=5
         )
     
-    def tearDown(self):
-        """Clean up after tests."""
-        self.processor.close()
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after all tests."""
+        cls.processor.close()
     
-    def test_404_gives_up_immediately(self):
-        """Test that 404 errors don't retry."""
-        def mock_404_response(*args, **kwargs):
-            response = Mock()
-            response.status_code = 404
-            return response
+    def setUp(self):
+        """Start each test with fresh counters and no real sleeps."""
+        self.processor.reset_stats()
         
-        with patch.object(self.processor.session, 'get', side_effect=mock_404_response):
-            result = self.processor.process_page("https://example.com/404_test")
-            
-            # Should fail without retries
-            self.assertFalse(result.success)
-            
-            stats = self.processor.get_stats()
-            self.assertEqual(stats['requests_made'], 1)  # Only one request
-            self.assertEqual(stats['retries_attempted'], 0)  # No retries
-            self.assertEqual(stats['permanent_failures'], 1)  # Marked as permanent failure
-    
-    def test_403_gives_up_immediately(self):
-        """Test that 403 errors don't retry."""
-        def mock_403_response(*args, **kwargs):
-            response = Mock()
-            response.status_code = 403
-            return response
+        # Rate limiting and retry backoff advance a fake clock instead of waiting
+        self.clock = FakeClock()
+        clock_patcher = patch('wikipedia_crawler.core.page_processor.time', self.clock)
+        clock_patcher.start()
+        self.addCleanup(clock_patcher.stop)
         
-        with patch.object(self.processor.session, 'get', side_effect=mock_403_response):
-            result = self.processor.process_page("https://example.com/403_test")
-            
-            # Should fail without retries
-            self.assertFalse(result.success)
-            
-            stats = self.processor.get_stats()
-            self.assertEqual(stats['requests_made'], 1)  # Only one request
-            self.assertEqual(stats['retries_attempted'], 0)  # No retries
-            self.assertEqual(stats['permanent_failures'], 1)  # Marked as permanent failure
+        # No earlier request to space out from, so only retry backoff sleeps
+        self.processor._last_request_time = float('-inf')
+    
+    def test_permanent_failures_give_up_immediately(self):
+        """Test that permanent HTTP failures (404, 403, 410, 451) don't retry."""
+        for status, response in PERMANENT_FAILURE_RESPONSES.items():
+            with self.subTest(status=status):
+                self.processor.reset_stats()
+                
+                with patch.object(self.processor.session, 'get', return_value=response):
+                    result = self.processor.process_page(f"https://example.com/{status}_test")
+                
+                # Should fail without retries
+                self.assertFalse(result.success)
+                
+                stats = self.processor.get_stats()
+                self.assertEqual(stats['requests_made'], 1)  # Only one request
+                self.assertEqual(stats['retries_attempted'], 0)  # No retries
+                self.assertEqual(stats['permanent_failures'], 1)  # Marked as permanent failure
     
     def test_500_retries_with_backoff(self):
         """Test that 500 errors retry with exponential backoff."""
-        def mock_500_response(*args, **kwargs):
-            response = Mock()
-            response.status_code = 500
-            return response
-        
-        with patch.object(self.processor.session, 'get', side_effect=mock_500_response):
-            result = self.processor.process_page("https://example.com/500_test")
+        url = "https://example.com/500_test"
+        # Connectivity is fine, so the URL is failed without prompting the user
+        with patch.object(self.processor.session, 'get', return_value=RESP_500), \
+             patch.object(self.processor, '_test_network_connectivity', return_value=True):
+            result = self.processor.process_page(url)
             
             # Should fail after retries
             self.assertFalse(result.success)
@@ -76,47 +77,34 @@ class TestErrorHandling(unittest.TestCase):
             self.assertEqual(stats['requests_made'], 3)  # 1 initial + 2 retries
             self.assertEqual(stats['retries_attempted'], 2)  # 2 retries
             self.assertEqual(stats['total_failures'], 1)  # Marked as total failure
-    
-    def test_timeout_retries(self):
-        """Test that timeout errors retry."""
-        def mock_timeout(*args, **kwargs):
-            raise requests.exceptions.Timeout("Request timed out")
         
-        with patch.object(self.processor.session, 'get', side_effect=mock_timeout):
-            result = self.processor.process_page("https://example.com/timeout_test")
-            
-            # Should fail after retries
-            self.assertFalse(result.success)
-            
-            stats = self.processor.get_stats()
-            self.assertEqual(stats['retries_attempted'], 2)  # 2 retries
-            self.assertEqual(stats['timeout_errors'], 3)  # 1 initial + 2 retries
+        # Waits double between attempts: ~0.01s, then ~0.02s
+        assert_backoff_sleeps(self.clock.sleeps, delay=0.01, max_retries=2)
     
-    def test_connection_error_retries(self):
-        """Test that connection errors retry."""
-        def mock_connection_error(*args, **kwargs):
-            raise requests.exceptions.ConnectionError("Connection failed")
+    def test_network_errors_retry(self):
+        """Test that timeouts and connection errors retry."""
+        cases = (
+            (requests.exceptions.Timeout("Request timed out"), 'timeout_errors'),
+            (requests.exceptions.ConnectionError("Connection failed"), 'connection_errors'),
+        )
         
-        with patch.object(self.processor.session, 'get', side_effect=mock_connection_error):
-            result = self.processor.process_page("https://example.com/connection_test")
-            
-            # Should fail after retries
-            self.assertFalse(result.success)
-            
-            stats = self.processor.get_stats()
-            self.assertEqual(stats['retries_attempted'], 2)  # 2 retries
-            self.assertEqual(stats['connection_errors'], 3)  # 1 initial + 2 retries
+        for error, counter in cases:
+            with self.subTest(error=type(error).__name__):
+                self.processor.reset_stats()
+                
+                with patch.object(self.processor.session, 'get', side_effect=error):
+                    result = self.processor.process_page("https://example.com/network_error_test")
+                
+                # Should fail after retries
+                self.assertFalse(result.success)
+                
+                stats = self.processor.get_stats()
+                self.assertEqual(stats['retries_attempted'], 2)  # 2 retries
+                self.assertEqual(stats[counter], 3)  # 1 initial + 2 retries
     
     def test_success_no_retries(self):
         """Test that successful requests don't retry."""
-        def mock_success_response(*args, **kwargs):
-            response = Mock()
-            response.status_code = 200
-            response.text = "<html><body><h1>Test Page</h1></body></html>"
-            response.headers = {'content-type': 'text/html'}
-            return response
-        
-        with patch.object(self.processor.session, 'get', side_effect=mock_success_response):
+        with patch.object(self.processor.session, 'get', return_value=RESP_200):
             result = self.processor.process_page("https://example.com/success_test")
             
             # Should succeed
@@ -1,73 +1,69 @@
 #!/usr/bin/env python3
 """
 Test the fixed URL processing.
+
+The default test reads the page HTML from the committed fixture in
+tests/fixtures, so it runs offline. test_fixed_url_live fetches the page
+from Wikipedia and is marked ``network``, which pytest.ini deselects by
+default; run it with -m network, or run this script with --live.
 """
 
-import sys
-import requests
+import argparse
+import tempfile
 from pathlib import Path
 
-# Add the project root to Python path
-sys.path.insert(0, str(Path(__file__).parent))
+import pytest
 
 from wikipedia_crawler.processors.article_handler import ArticlePageHandler
-from wikipedia_crawler.processors.language_filter import LanguageFilter
 from wikipedia_crawler.core.file_storage import FileStorage
+from wikipedia_crawler.utils.html_cache import fetch_html_cached
+from tests._fixtures import load_html
 
 
-def test_fixed_url():
-    """Test the fixed URL processing."""
-    url = "https://en.wikipedia.org/wiki/History_of_the_Jews_in_Singapore"
-    
-    print(f"🧪 Testing fixed URL processing: {url}")
-    print("=" * 60)
+FIXED_URL = "https://en.wikipedia.org/wiki/History_of_the_Jews_in_Singapore"
+FIXED_TITLE = "History of the Jews in Singapore"
+FIXTURE_NAME = "history_of_the_jews_in_singapore.html"
+
+# A near-empty article means extraction stripped the page body again
+MIN_CONTENT_LENGTH = 1000
+
+
+def check_fixed_url(output_dir: Path, html_content: str) -> None:
+    """
+    Process the previously failing page and check the saved article.
     
-    # Fetch content first
-    print("📥 Fetching HTML content...")
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (compatible; WikipediaCrawler/1.0; Educational Research)'
-    }
+    Args:
+        output_dir: Directory for the FileStorage output
+        html_content: HTML of the page at FIXED_URL
+    """
+    article_handler = ArticlePageHandler(FileStorage(output_dir))
+    result = article_handler.process_article(FIXED_URL, html_content)
     
-    try:
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        html_content = response.text
-        print(f"✅ Fetched {len(html_content)} characters of HTML")
-        
-        # Initialize components
-        file_storage = FileStorage("test_output")
-        article_handler = ArticlePageHandler(file_storage)
-        
-        # Process the article
-        print("📥 Processing article...")
-        result = article_handler.process_article(url, html_content)
-        
-        if result.success:
-            print(f"✅ Article processing succeeded!")
-            print(f"📄 URL: {result.url}")
-            print(f"📄 Page type: {result.page_type}")
-            if result.content:
-                print(f"📏 Content length: {len(result.content)} characters")
-                print(f"📝 Content preview: {result.content[:200]}...")
-            if result.data:
-                print(f"📊 Data keys: {list(result.data.keys())}")
-                if 'content_length' in result.data:
-                    print(f"📏 Processed content length: {result.data['content_length']} characters")
-                if 'title' in result.data:
-                    print(f"📄 Title: {result.data['title']}")
-                if 'language' in result.data:
-                    print(f"🌐 Language: {result.data['language']}")
-                if 'filtered' in result.data:
-                    print(f"🔍 Filtered: {result.data['filtered']}")
-            
-        else:
-            print(f"❌ Article processing failed: {result.error_message}")
-            
-    except Exception as e:
-        print(f"❌ Test failed with exception: {e}")
-        import traceback
-        traceback.print_exc()
+    assert result.success, result.error_message
+    assert result.data['title'] == FIXED_TITLE
+    assert not result.data['filtered']
+    assert result.data['language'] == 'en'
+    assert result.data['content_length'] >= MIN_CONTENT_LENGTH
+
+
+def test_fixed_url(tmp_path):
+    """Test the fixed URL processing on the cached fixture."""
+    check_fixed_url(tmp_path, load_html(FIXTURE_NAME))
+
+
+@pytest.mark.network
+def test_fixed_url_live(tmp_path):
+    """Test the fixed URL processing on the live page."""
+    check_fixed_url(tmp_path, fetch_html_cached(FIXED_URL, max_age=0))
 
 
 if __name__ == "__main__":
-    test_fixed_url()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Test processing of a previously failing URL")
+    parser.add_argument('--live', action='store_true',
+                        help='Fetch the page from Wikipedia instead of using the fixture')
+    args = parser.parse_args()
+    
+    html_content = fetch_html_cached(FIXED_URL, max_age=0) if args.live else load_html(FIXTURE_NAME)
+    with tempfile.TemporaryDirectory() as output_dir:
+        check_fixed_url(Path(output_dir), html_content)
+    print(f"✅ {FIXED_URL} processed successfully")
@@ -0,0 +1,52 @@
+"""Fake clock for tests that exercise retry backoff and rate limiting."""
+
+import math
+from typing import List
+
+
+class FakeClock:
+    """
+    Stand-in for the time module that advances logically instead of waiting.
+    
+    Patch it over a module's ``time`` name so sleeps return immediately while
+    time()/monotonic() still observe the delays that would have elapsed.
+    """
+    
+    def __init__(self, start: float = 0.0):
+        self.now = start
+        self.sleeps: List[float] = []
+    
+    def time(self) -> float:
+        return self.now
+    
+    def monotonic(self) -> float:
+        return self.now
+    
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += max(seconds, 0.0)
+
+
+def assert_backoff_sleeps(sleeps: List[float], delay: float, max_retries: int,
+                          fetches: int = 1) -> None:
+    """
+    Assert that recorded sleeps follow PageProcessor's retry backoff.
+    
+    Every fetch that exhausts its retries sleeps max_retries times. Within a
+    fetch each wait is delay * 2**attempt plus at most ±5% jitter, and since
+    the jitter is fixed per URL each wait is exactly double the one before.
+    
+    Args:
+        sleeps: Durations recorded by FakeClock.sleep
+        delay: The processor's delay_between_requests
+        max_retries: The processor's max_retries
+        fetches: Number of failed fetches expected in sleeps
+    """
+    assert len(sleeps) == max_retries * fetches, sleeps
+    for start in range(0, len(sleeps), max_retries):
+        waits = sleeps[start:start + max_retries]
+        for attempt, wait in enumerate(waits):
+            base = delay * (2 ** attempt)
+            assert base * 0.95 <= wait <= base * 1.05, (attempt, wait)
+        for previous, wait in zip(waits, waits[1:]):
+            assert math.isclose(wait, 2 * previous), (previous, wait)
@@ -0,0 +1,70 @@
+"""Shared loaders for cached test fixtures and in-memory test doubles."""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+
+from bs4 import BeautifulSoup
+
+from wikipedia_crawler.utils import sanitize_wikipedia_title, create_unique_filename
+from wikipedia_crawler.utils.html_parser import HTML_PARSER
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@lru_cache(maxsize=None)
+def load_html(name: str) -> str:
+    """
+    Load an HTML fixture, reading each file at most once per process.
+    
+    Args:
+        name: File name of the fixture inside tests/fixtures
+    
+    Returns:
+        Fixture content as text
+    """
+    return (FIXTURES_DIR / name).read_text(encoding='utf-8')
+
+
+@lru_cache(maxsize=None)
+def parse_html(markup: str) -> BeautifulSoup:
+    """
+    Parse HTML once per process and share the tree between tests.
+    
+    Callers must treat the returned tree as read-only.
+    
+    Args:
+        markup: HTML to parse
+    
+    Returns:
+        Parsed tree of the markup
+    """
+    return BeautifulSoup(markup, HTML_PARSER)
+
+
+class InMemoryFileStorage:
+    """
+    Dict-backed stand-in for FileStorage in tests that never read saved files.
+    
+    Payloads are kept in ``files`` under the file name a real FileStorage
+    would have used, so tests can still check what was saved without disk I/O.
+    """
+    
+    def __init__(self):
+        self.files: Dict[str, Dict[str, Any]] = {}
+    
+    def save_article(self, data) -> str:
+        """Store an article's payload and return its file name."""
+        filename = sanitize_wikipedia_title(data.title, page_type='article')
+        return self._save(filename, data.to_dict())
+    
+    def save_category(self, data) -> str:
+        """Store a category's payload and return its file name."""
+        filename = sanitize_wikipedia_title(data.title, page_type='category')
+        return self._save(filename, data.to_dict())
+    
+    def _save(self, filename: str, payload: Dict[str, Any]) -> str:
+        unique_filename = create_unique_filename(filename, self.files)
+        self.files[unique_filename] = payload
+        return unique_filename
@@ -1,40 +1,221 @@
 """Unit tests for ArticlePageHandler."""
 
+import os
 import pytest
 from pathlib import Path
-import tempfile
-import shutil
-import json
+import orjson
 from unittest.mock import Mock, patch
+from bs4 import BeautifulSoup
 
 from wikipedia_crawler.processors.article_handler import ArticlePageHandler
 from wikipedia_crawler.processors.content_processor import ContentProcessor
 from wikipedia_crawler.processors.language_filter import LanguageFilter
 from wikipedia_crawler.core.file_storage import FileStorage
+from wikipedia_crawler.core.page_processor import PageProcessor
 from wikipedia_crawler.models.data_models import ArticleData
+from tests._fixtures import InMemoryFileStorage, parse_html
+
+
+# Every parse names its parser and the malformed inputs are not URL- or
+# path-like, so bs4 should never need to warn; fail if that regresses
+pytestmark = pytest.mark.filterwarnings(
+    "error::bs4.GuessedAtParserWarning",
+    "error::bs4.MarkupResemblesLocatorWarning",
+)
+
+
+# Pages for the title and content extraction tests; their trees are parsed once
+# via parse_html and shared, since extraction only reads the tree
+TITLE_FROM_H1_HTML = '''
+<html>
+<body>
+<h1 id="firstHeading">Title from H1</h1>
+<div id="mw-content-text">
+<p>This is substantial content for testing title extraction methods.</p>
+<p>It has multiple paragraphs to ensure it passes content validation.</p>
+</div>
+</body>
+</html>
+'''
+
+TITLE_FROM_HEAD_HTML = '''
+<html>
+<head><title>Title from Head - Wikipedia</title></head>
+<body>
+<div id="mw-content-text">
+<p>This is substantial content for testing title extraction from head tag.</p>
+<p>Multiple paragraphs ensure content validation passes successfully.</p>
+</div>
+</body>
+</html>
+'''
+
+TITLE_FROM_URL_HTML = '''
+<html>
+<body>
+<div id="mw-content-text">
+<p>This content has no title elements, so title should come from URL.</p>
+<p>Multiple paragraphs ensure the content passes validation checks.</p>
+</div>
+</body>
+</html>
+'''
+
+CONTENT_PARSER_OUTPUT_HTML = '''
+<html>
+<body>
+<h1 id="firstHeading">Test</h1>
+<div id="mw-content-text">
+<div class="mw-parser-output">
+<p>Main content here with substantial text for testing extraction methods.</p>
+<p>Additional paragraph to ensure content validation passes.</p>
+</div>
+</div>
+</body>
+</html>
+'''
+
+CONTENT_DIRECT_PARSER_OUTPUT_HTML = '''
+<html>
+<body>
+<h1 id="firstHeading">Test</h1>
+<div class="mw-parser-output">
+<p>Parser output content with substantial text for testing.</p>
+<p>Multiple paragraphs ensure content validation succeeds.</p>
+</div>
+</body>
+</html>
+'''
+
+CONTENT_BODY_CONTENT_HTML = '''
+<html>
+<body>
+<h1 id="firstHeading">Test</h1>
+<div id="bodyContent">
+<p>Body content here with substantial text for testing extraction.</p>
+<p>Additional content to ensure validation passes successfully.</p>
+</div>
+</body>
+</html>
+'''
+
+# (id, url, html, expected title) for each title and content extraction fallback
+EXTRACTION_CASES = [
+    ("title-h1", "https://en.wikipedia.org/wiki/Test1", TITLE_FROM_H1_HTML, 'Title from H1'),
+    ("title-head", "https://en.wikipedia.org/wiki/Test2", TITLE_FROM_HEAD_HTML, 'Title from Head'),
+    ("title-url", "https://en.wikipedia.org/wiki/URL_Title_Test", TITLE_FROM_URL_HTML, 'URL Title Test'),
+    ("content-parser-output", "https://en.wikipedia.org/wiki/Test1", CONTENT_PARSER_OUTPUT_HTML, 'Test'),
+    ("content-direct-parser-output", "https://en.wikipedia.org/wiki/Test2",
+     CONTENT_DIRECT_PARSER_OUTPUT_HTML, 'Test'),
+    ("content-body-content", "https://en.wikipedia.org/wiki/Test3", CONTENT_BODY_CONTENT_HTML, 'Test'),
+]
+
+
+MALFORMED_HTML = [
+    "",  # Empty content
+    "<html><body></body></html>",  # No content
+    "<html><body><h1>Broken HTML",  # Unclosed tags
+    "Not HTML at all",  # Plain text
+]
+MALFORMED_HTML_IDS = ["empty", "no-content", "unclosed-tags", "plain-text"]
+
+# Statistics tracking pages; the French copy differs only in its heading
+SUCCESS_ARTICLE_HTML = '''
+<html>
+<body>
+<h1 id="firstHeading">Success Article</h1>
+<div id="mw-content-text">
+<p>This article will be processed successfully with substantial content.</p>
+<p>It contains multiple paragraphs to ensure proper validation and processing.</p>
+</div>
+</body>
+</html>
+'''
+
+FRENCH_ARTICLE_HTML = SUCCESS_ARTICLE_HTML.replace('Success Article', 'French Article')
+
+# Fragments for the substantial content check, parsed once at import
+SUBSTANTIAL_DIV = parse_html('''
+<div>
+<p>This is a substantial paragraph with enough content to be considered meaningful.</p>
+<p>Another paragraph with more content and information.</p>
+<h2>A heading</h2>
+<p>More content under the heading.</p>
+</div>
+''').find('div')
+
+MINIMAL_DIV = parse_html('''
+<div>
+<p>Short.</p>
+</div>
+''').find('div')
+
+
+def _json_files(directory):
+    """List paths of the JSON files saved directly inside a directory."""
+    return [entry.path for entry in os.scandir(directory) if entry.name.endswith('.json')]
+
+
+def _load_json(path):
+    """Load a saved JSON file straight from its bytes."""
+    return orjson.loads(Path(path).read_bytes())
+
+
+@pytest.fixture(scope="session")
+def shared_handler():
+    """Article handler whose processors are built once for the whole run."""
+    return ArticlePageHandler(
+        InMemoryFileStorage(),
+        ContentProcessor(),
+        LanguageFilter()
+    )
+
+
+@pytest.fixture
+def filtered_language_filter():
+    """Language filter that rejects every page as French."""
+    mock = Mock(spec=LanguageFilter)
+    mock.filter_content.return_value = (False, 'fr')
+    return mock
+
+
+@pytest.fixture
+def failing_content_processor():
+    """Content processor whose processing always raises."""
+    mock = Mock(spec=ContentProcessor)
+    mock.process_content.side_effect = Exception("Processing failed")
+    return mock
+
+
+@pytest.fixture
+def failing_file_storage():
+    """File storage whose article saves always fail."""
+    mock = Mock(spec=FileStorage)
+    mock.save_article.side_effect = IOError("Disk full")
+    return mock
 
 
 class TestArticlePageHandler:
     """Test suite for ArticlePageHandler."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.file_storage = FileStorage(self.temp_dir)
-        self.content_processor = ContentProcessor()
-        self.language_filter = LanguageFilter()
-        self.handler = ArticlePageHandler(
-            self.file_storage,
-            self.content_processor,
-            self.language_filter
-        )
+    @pytest.fixture(autouse=True)
+    def _setup(self, shared_handler):
+        """Give the shared handler fresh in-memory storage and zero its stats."""
+        self.file_storage = InMemoryFileStorage()
+        self.handler = shared_handler
+        self.handler.file_storage = self.file_storage
+        self.handler.reset_stats()
+        self.handler.language_filter.reset_stats()
+        self.content_processor = self.handler.content_processor
+        self.language_filter = self.handler.language_filter
     
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+    @pytest.fixture
+    def on_disk(self, tmp_path):
+        """Save through a real FileStorage in the test's tmp_path."""
+        self.temp_dir = tmp_path
+        self.handler.file_storage = FileStorage(tmp_path)
     
-    def test_process_article_success_english(self):
+    def test_process_article_success_english(self, on_disk):
         """Test successful processing of an English Wikipedia article."""
         html_content = '''
         <html>
@@ -67,18 +248,68 @@ class TestArticlePageHandler:
         assert result.data['content_length'] > 0
         
         # Check that file was saved
-        saved_files = list(self.temp_dir.glob("*.json"))
+        saved_files = _json_files(self.temp_dir)
         assert len(saved_files) == 1
         
         # Verify file content
-        with open(saved_files[0], 'r', encoding='utf-8') as f:
-            saved_data = json.load(f)
+        saved_data = _load_json(saved_files[0])
         
         assert saved_data['title'] == 'Singapore'
         assert saved_data['type'] == 'article'
         assert saved_data['language'] == 'en'
         assert 'Singapore is a sovereign city-state' in saved_data['content']
     
+    def test_process_article_with_parsed_dom(self):
+        """Test that a pre-parsed tree is used instead of re-parsing content."""
+        html_content = '''
+        <html>
+        <head><title>Singapore - Wikipedia</title></head>
+        <body>
+        <h1 id="firstHeading">Singapore</h1>
+        <div id="mw-content-text">
+        <div class="mw-parser-output">
+        <p>Singapore is a sovereign city-state and island country in Southeast Asia.</p>
+        <h2>History</h2>
+        <p>Singapore was founded as a British trading colony in 1819.</p>
+        </div>
+        </div>
+        </body>
+        </html>
+        '''
+        dom = BeautifulSoup(html_content, 'html.parser')
+        
+        with patch('wikipedia_crawler.processors.article_handler.BeautifulSoup',
+                   wraps=BeautifulSoup) as mock_parser:
+            result = self.handler.process_article(
+                url="https://en.wikipedia.org/wiki/Singapore",
+                content=html_content,
+                dom=dom
+            )
+        
+        assert result.success
+        assert result.data['title'] == 'Singapore'
+        
+        # The full page must not have been parsed again
+        parsed_inputs = [call.args[0] for call in mock_parser.call_args_list]
+        assert html_content not in parsed_inputs
+    
+    def test_page_processor_dom_matches_own_parse(self):
+        """Test that the tree from PageProcessor gives the same result as parsing content."""
+        url = "https://en.wikipedia.org/wiki/Success_Article"
+        response = Mock(text=SUCCESS_ARTICLE_HTML, status_code=200, headers={})
+        with patch.object(PageProcessor, '_fetch_page', return_value=response):
+            page_result = PageProcessor(delay_between_requests=0).process_page(url)
+        
+        from_dom = self.handler.process_article(url, page_result.content, dom=page_result.parsed_dom)
+        dom_files = list(self.file_storage.files.values())
+        self.file_storage.files.clear()
+        parsed = self.handler.process_article(url, page_result.content)
+        parsed_files = list(self.file_storage.files.values())
+        
+        assert from_dom.success and parsed.success
+        assert from_dom.data == parsed.data
+        assert [f['content'] for f in dom_files] == [f['content'] for f in parsed_files]
+    
     def test_process_article_success_chinese(self):
         """Test successful processing of a Chinese Wikipedia article."""
         html_content = '''
@@ -108,16 +339,12 @@ class TestArticlePageHandler:
         assert result.data['language'] == 'zh'
         assert not result.data['filtered']
     
-    def test_process_article_filtered_language(self):
+    def test_process_article_filtered_language(self, filtered_language_filter):
         """Test article filtering for unsupported language."""
-        # Mock language filter to return unsupported language
-        mock_language_filter = Mock()
-        mock_language_filter.filter_content.return_value = (False, 'fr')
-        
         handler = ArticlePageHandler(
             self.file_storage,
             self.content_processor,
-            mock_language_filter
+            filtered_language_filter
         )
         
         html_content = '''
@@ -143,8 +370,7 @@ class TestArticlePageHandler:
         assert 'Unsupported language' in result.data['reason']
         
         # No file should be saved for filtered content
-        saved_files = list(self.temp_dir.glob("*.json"))
-        assert len(saved_files) == 0
+        assert self.file_storage.files == {}
     
     def test_process_article_no_content(self):
         """Test handling of pages with no extractable content."""
@@ -167,147 +393,47 @@ class TestArticlePageHandler:
         assert not result.success
         assert "Insufficient content after processing" in result.error_message
     
-    def test_process_article_malformed_html(self):
-        """Test handling of malformed HTML content."""
-        malformed_htmls = [
-            "",  # Empty content
-            "<html><body></body></html>",  # No content
-            "<html><body><h1>Broken HTML",  # Unclosed tags
-            "Not HTML at all",  # Plain text
-        ]
-        
-        for html in malformed_htmls:
-            result = self.handler.process_article(
-                url="https://en.wikipedia.org/wiki/Test",
-                content=html
-            )
-            
-            # Should not crash, but may fail gracefully
-            assert isinstance(result.success, bool)
-            if not result.success:
-                assert result.error_message is not None
-    
-    def test_title_extraction_methods(self):
-        """Test various methods of title extraction."""
-        # Test with firstHeading
-        html1 = '''
-        <html>
-        <body>
-        <h1 id="firstHeading">Title from H1</h1>
-        <div id="mw-content-text">
-        <p>This is substantial content for testing title extraction methods.</p>
-        <p>It has multiple paragraphs to ensure it passes content validation.</p>
-        </div>
-        </body>
-        </html>
-        '''
-        
-        result1 = self.handler.process_article(
-            url="https://en.wikipedia.org/wiki/Test1",
-            content=html1
-        )
-        assert result1.success
-        assert result1.data['title'] == 'Title from H1'
+    def test_process_article_without_text_skips_conversion(self):
+        """Test that pages with no text are rejected before markdown conversion."""
+        content_processor = Mock(spec=ContentProcessor)
+        handler = ArticlePageHandler(self.file_storage, content_processor, self.language_filter)
         
-        # Test with title tag
-        html2 = '''
-        <html>
-        <head><title>Title from Head - Wikipedia</title></head>
-        <body>
-        <div id="mw-content-text">
-        <p>This is substantial content for testing title extraction from head tag.</p>
-        <p>Multiple paragraphs ensure content validation passes successfully.</p>
-        </div>
-        </body>
-        </html>
-        '''
-        
-        result2 = self.handler.process_article(
-            url="https://en.wikipedia.org/wiki/Test2",
-            content=html2
+        result = handler.process_article(
+            url="https://en.wikipedia.org/wiki/Empty_Headings",
+            content='<div id="mw-content-text"><h2></h2><h2></h2><ul><li></li></ul></div>'
         )
-        assert result2.success
-        assert result2.data['title'] == 'Title from Head'
         
-        # Test with URL fallback
-        html3 = '''
-        <html>
-        <body>
-        <div id="mw-content-text">
-        <p>This content has no title elements, so title should come from URL.</p>
-        <p>Multiple paragraphs ensure the content passes validation checks.</p>
-        </div>
-        </body>
-        </html>
-        '''
-        
-        result3 = self.handler.process_article(
-            url="https://en.wikipedia.org/wiki/URL_Title_Test",
-            content=html3
-        )
-        assert result3.success
-        assert result3.data['title'] == 'URL Title Test'
+        assert not result.success
+        assert "Insufficient content after processing" in result.error_message
+        content_processor.process_content.assert_not_called()
     
-    def test_content_extraction_methods(self):
-        """Test various methods of content extraction."""
-        # Test with mw-content-text and mw-parser-output
-        html1 = '''
-        <html>
-        <body>
-        <h1 id="firstHeading">Test</h1>
-        <div id="mw-content-text">
-        <div class="mw-parser-output">
-        <p>Main content here with substantial text for testing extraction methods.</p>
-        <p>Additional paragraph to ensure content validation passes.</p>
-        </div>
-        </div>
-        </body>
-        </html>
-        '''
-        
-        result1 = self.handler.process_article(
-            url="https://en.wikipedia.org/wiki/Test1",
-            content=html1
-        )
-        assert result1.success
-        
-        # Test with just mw-parser-output
-        html2 = '''
-        <html>
-        <body>
-        <h1 id="firstHeading">Test</h1>
-        <div class="mw-parser-output">
-        <p>Parser output content with substantial text for testing.</p>
-        <p>Multiple paragraphs ensure content validation succeeds.</p>
-        </div>
-        </body>
-        </html>
-        '''
-        
-        result2 = self.handler.process_article(
-            url="https://en.wikipedia.org/wiki/Test2",
-            content=html2
+    @pytest.mark.parametrize("html", MALFORMED_HTML, ids=MALFORMED_HTML_IDS)
+    def test_process_article_malformed_html(self, html):
+        """Test handling of malformed HTML content."""
+        result = self.handler.process_article(
+            url="https://en.wikipedia.org/wiki/Test",
+            content=html
         )
-        assert result2.success
         
-        # Test with bodyContent fallback
-        html3 = '''
-        <html>
-        <body>
-        <h1 id="firstHeading">Test</h1>
-        <div id="bodyContent">
-        <p>Body content here with substantial text for testing extraction.</p>
-        <p>Additional content to ensure validation passes successfully.</p>
-        </div>
-        </body>
-        </html>
-        '''
-        
-        result3 = self.handler.process_article(
-            url="https://en.wikipedia.org/wiki/Test3",
-            content=html3
+        # Should not crash, but may fail gracefully
+        assert isinstance(result.success, bool)
+        if not result.success:
+            assert result.error_message is not None
+    
+    @pytest.mark.parametrize(
+        "url,html,expected_title",
+        [case[1:] for case in EXTRACTION_CASES],
+        ids=[case[0] for case in EXTRACTION_CASES]
+    )
+    def test_extraction_methods(self, url, html, expected_title):
+        """Test each title and content extraction fallback."""
+        result = self.handler.process_article(
+            url=url,
+            content=html,
+            dom=parse_html(html)
         )
-        assert result3.success
+        assert result.success
+        assert result.data['title'] == expected_title
     
     def test_content_processor_integration(self):
         """Test integration with ContentProcessor."""
@@ -336,13 +462,10 @@ class TestArticlePageHandler:
         
         assert result.success
         
-        # Check that file was saved and content was processed
-        saved_files = list(self.temp_dir.glob("*.json"))
-        assert len(saved_files) == 1
-        
-        with open(saved_files[0], 'r', encoding='utf-8') as f:
-            saved_data = json.load(f)
+        # Check that the article was saved and content was processed
+        assert len(self.file_storage.files) == 1
         
+        saved_data, = self.file_storage.files.values()
         content = saved_data['content']
         
         # Should contain processed markdown
@@ -398,42 +521,27 @@ class TestArticlePageHandler:
         assert not result_zh.data['filtered']
         assert result_zh.data['language'] == 'zh'
     
-    def test_statistics_tracking(self):
+    def test_statistics_tracking(self, filtered_language_filter):
         """Test that processing statistics are tracked correctly."""
         initial_stats = self.handler.get_stats()
         
         # Process successful article
-        html_success = '''
-        <html>
-        <body>
-        <h1 id="firstHeading">Success Article</h1>
-        <div id="mw-content-text">
-        <p>This article will be processed successfully with substantial content.</p>
-        <p>It contains multiple paragraphs to ensure proper validation and processing.</p>
-        </div>
-        </body>
-        </html>
-        '''
-        
         result1 = self.handler.process_article(
             url="https://en.wikipedia.org/wiki/Success_Article",
-            content=html_success
+            content=SUCCESS_ARTICLE_HTML
         )
         assert result1.success
         
         # Process article that will be filtered
-        mock_language_filter = Mock()
-        mock_language_filter.filter_content.return_value = (False, 'fr')
-        
         handler_with_mock = ArticlePageHandler(
             self.file_storage,
             self.content_processor,
-            mock_language_filter
+            filtered_language_filter
         )
         
         result2 = handler_with_mock.process_article(
             url="https://fr.wikipedia.org/wiki/French_Article",
-            content=html_success.replace('Success Article', 'French Article')
+            content=FRENCH_ARTICLE_HTML
         )
         assert result2.success and result2.data['filtered']
         
@@ -444,15 +552,11 @@ class TestArticlePageHandler:
         assert final_stats['articles_saved'] == initial_stats['articles_saved'] + 1
         assert 'en' in final_stats['languages_detected']
     
-    def test_error_handling_content_processor_failure(self):
+    def test_error_handling_content_processor_failure(self, failing_content_processor):
         """Test error handling when ContentProcessor fails."""
-        # Mock content processor to raise an exception
-        mock_content_processor = Mock()
-        mock_content_processor.process_content.side_effect = Exception("Processing failed")
-        
         handler = ArticlePageHandler(
             self.file_storage,
-            mock_content_processor,
+            failing_content_processor,
             self.language_filter
         )
         
@@ -473,14 +577,10 @@ class TestArticlePageHandler:
         assert not result.success
         assert "Content processing failed" in result.error_message
     
-    def test_error_handling_file_storage_failure(self):
+    def test_error_handling_file_storage_failure(self, failing_file_storage):
         """Test error handling when FileStorage fails."""
-        # Mock file storage to raise an exception
-        mock_file_storage = Mock()
-        mock_file_storage.save_article.side_effect = IOError("Disk full")
-        
         handler = ArticlePageHandler(
-            mock_file_storage,
+            failing_file_storage,
             self.content_processor,
             self.language_filter
         )
@@ -507,33 +607,8 @@ class TestArticlePageHandler:
     
     def test_substantial_content_detection(self):
         """Test detection of substantial article content."""
-        # Test with substantial content
-        substantial_html = '''
-        <div>
-        <p>This is a substantial paragraph with enough content to be considered meaningful.</p>
-        <p>Another paragraph with more content and information.</p>
-        <h2>A heading</h2>
-        <p>More content under the heading.</p>
-        </div>
-        '''
-        
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(substantial_html, 'html.parser')
-        div = soup.find('div')
-        
-        assert self.handler._is_substantial_content(div)
-        
-        # Test with minimal content
-        minimal_html = '''
-        <div>
-        <p>Short.</p>
-        </div>
-        '''
-        
-        soup = BeautifulSoup(minimal_html, 'html.parser')
-        div = soup.find('div')
-        
-        assert not self.handler._is_substantial_content(div)
+        assert self.handler._is_substantial_content(SUBSTANTIAL_DIV)
+        assert not self.handler._is_substantial_content(MINIMAL_DIV)
         
         # Test with no content
         assert not self.handler._is_substantial_content(None)
@@ -583,4 +658,5 @@ class TestArticlePageHandler:
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    # The module is cheap to run; skip .pytest_cache reads/writes
+    pytest.main([__file__, "-v", "-p", "no:cacheprovider"])
\ No newline at end of file
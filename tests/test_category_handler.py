@@ -1,11 +1,9 @@
 """Property-based tests for CategoryPageHandler."""
 
+import orjson
 import pytest
 from hypothesis import given, strategies as st, assume, settings
 from bs4 import BeautifulSoup
-from pathlib import Path
-import tempfile
-import shutil
 from unittest.mock import Mock, patch
 
 from wikipedia_crawler.processors.category_handler import CategoryPageHandler
@@ -13,6 +11,40 @@ from wikipedia_crawler.core.file_storage import FileStorage
 from wikipedia_crawler.models.data_models import CategoryData
 
 
+# Special-page path fragments that must never appear in discovered URLs
+INVALID_URL_PATTERNS = ('/Special:', '/Help:', '/Template:', '/User:', '/Talk:')
+
+# Deletes the filler characters that sanitization would strip from a title
+_FILLER = str.maketrans('', '', '_-. ()[]')
+
+MALFORMED_HTML = [
+    "",  # Empty content
+    "<html><body></body></html>",  # No category content
+    "<html><body><h1>No ID</h1></body></html>",  # Missing required elements
+    "<html><body><div>Broken HTML",  # Unclosed tags
+    "Not HTML at all",  # Plain text
+]
+MALFORMED_HTML_IDS = ["empty", "no-content", "no-heading-id", "unclosed-tags", "plain-text"]
+
+
+# Fixed fragments of generated category pages, joined with newlines
+_PAGE_HEAD = '''<!DOCTYPE html>
+<html>
+<head><title>Category:{title} - Wikipedia</title></head>
+<body>
+<h1 id="firstHeading">Category:{title}</h1>
+<div id="mw-content-text">'''
+_SUBCATEGORIES_OPEN = '''<div id="mw-subcategories">
+<h2>Subcategories</h2>
+<div class="CategoryTreeTag">'''
+_SUBCATEGORIES_CLOSE = '</div>\n</div>'
+_PAGES_OPEN = '''<div id="mw-pages">
+<h2>Pages in category "{title}"</h2>'''
+_PAGE_TAIL = '</div>\n</body>\n</html>'
+_SUBCATEGORY_LINK = '<a href="/wiki/Category:{0}">{1}</a>'.format
+_ARTICLE_LINK = '<a href="/wiki/{0}">{1}</a>'.format
+
+
 # Test data generators
 @st.composite
 def wikipedia_category_html(draw):
@@ -23,8 +55,7 @@ def wikipedia_category_html(draw):
     )))
     
     # Ensure title is not empty after stripping and has meaningful content
-    assume(len(title.strip()) > 0)
-    assume(not all(c in '_-. ()[]' for c in title.strip()))
+    assume(title.strip().translate(_FILLER))
     
     # Generate subcategories
     num_subcategories = draw(st.integers(min_value=0, max_value=10))
@@ -46,46 +77,33 @@ def wikipedia_category_html(draw):
         )))
         articles.append(article_name)
     
-    # Build HTML structure
-    html_parts = [
-        '<!DOCTYPE html>',
-        '<html>',
-        '<head><title>Category:' + title + ' - Wikipedia</title></head>',
-        '<body>',
-        '<h1 id="firstHeading">Category:' + title + '</h1>',
-        '<div id="mw-content-text">',
-    ]
+    # Build HTML structure; each name is turned into its URL slug only once
+    subcategory_slugs = [subcat.replace(' ', '_') for subcat in subcategories]
+    article_slugs = [article.replace(' ', '_') for article in articles]
+    
+    html_parts = [_PAGE_HEAD.format(title=title)]
     
     # Add subcategories section if any
     if subcategories:
-        html_parts.extend([
-            '<div id="mw-subcategories">',
-            '<h2>Subcategories</h2>',
-            '<div class="CategoryTreeTag">',
-        ])
-        for subcat in subcategories:
-            html_parts.append(f'<a href="/wiki/Category:{subcat.replace(" ", "_")}">{subcat}</a>')
-        html_parts.extend(['</div>', '</div>'])
+        html_parts.append(_SUBCATEGORIES_OPEN)
+        html_parts.extend(map(_SUBCATEGORY_LINK, subcategory_slugs, subcategories))
+        html_parts.append(_SUBCATEGORIES_CLOSE)
     
     # Add articles section if any
     if articles:
-        html_parts.extend([
-            '<div id="mw-pages">',
-            '<h2>Pages in category "' + title + '"</h2>',
-        ])
-        for article in articles:
-            html_parts.append(f'<a href="/wiki/{article.replace(" ", "_")}">{article}</a>')
+        html_parts.append(_PAGES_OPEN.format(title=title))
+        html_parts.extend(map(_ARTICLE_LINK, article_slugs, articles))
         html_parts.append('</div>')
     
-    html_parts.extend(['</div>', '</body>', '</html>'])
+    html_parts.append(_PAGE_TAIL)
     
     return {
         'html': '\n'.join(html_parts),
         'title': title,
-        'expected_subcategories': [f"https://en.wikipedia.org/wiki/Category:{s.replace(' ', '_')}" 
-                                 for s in subcategories],
-        'expected_articles': [f"https://en.wikipedia.org/wiki/{a.replace(' ', '_')}" 
-                            for a in articles]
+        'expected_subcategories': [f"https://en.wikipedia.org/wiki/Category:{slug}" 
+                                 for slug in subcategory_slugs],
+        'expected_articles': [f"https://en.wikipedia.org/wiki/{slug}" 
+                            for slug in article_slugs]
     }
 
 
@@ -105,19 +123,23 @@ def wikipedia_urls(draw):
         return f"https://en.wikipedia.org/wiki/{page_name.replace(' ', '_')}"
 
 
+@pytest.fixture(scope="class")
+def shared_handler(tmp_path_factory):
+    """Handler created once per test class; each test gives it fresh storage."""
+    return CategoryPageHandler(FileStorage(tmp_path_factory.mktemp("categories")), max_depth=5)
+
+
 class TestCategoryPageHandler:
     """Test suite for CategoryPageHandler with property-based testing."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.file_storage = FileStorage(self.temp_dir)
-        self.handler = CategoryPageHandler(self.file_storage, max_depth=5)
-    
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+    @pytest.fixture(autouse=True)
+    def _setup(self, shared_handler, tmp_path):
+        """Reuse the class-wide handler with new storage and zeroed stats."""
+        self.temp_dir = tmp_path
+        self.file_storage = FileStorage(tmp_path)
+        self.handler = shared_handler
+        self.handler.file_storage = self.file_storage
+        self.handler.reset_stats()
     
     @given(wikipedia_category_html())
     @settings(max_examples=50, deadline=5000)
@@ -144,16 +166,29 @@ class TestCategoryPageHandler:
         assert result.success, f"Processing failed: {result.error_message}"
         assert result.page_type == "category"
         
-        # Extract discovered URLs by type
+        # Classify and check every discovered URL in a single pass
         discovered_urls = result.discovered_urls or []
         discovered_subcategories = set()
         discovered_articles = set()
         
         for url in discovered_urls:
+            # Property 1c: No duplicates in discovered URLs
+            assert url not in discovered_subcategories and url not in discovered_articles, \
+                f"Duplicate URL found: {url}"
+            
             if '/Category:' in url:
                 discovered_subcategories.add(url)
             else:
                 discovered_articles.add(url)
+            
+            # Property 1d: All discovered URLs should be valid Wikipedia URLs
+            assert url.startswith('https://'), f"Non-HTTPS URL: {url}"
+            assert 'wikipedia.org' in url, f"Non-Wikipedia URL: {url}"
+            assert '/wiki/' in url, f"Invalid wiki URL: {url}"
+            
+            # Property 1e: No invalid URLs should be included (no special pages)
+            assert not any(pattern in url for pattern in INVALID_URL_PATTERNS), \
+                f"Invalid URL pattern found: {url}"
         
         # Property 1a: All expected subcategories should be found
         missing_subcategories = expected_subcategories - discovered_subcategories
@@ -162,22 +197,6 @@ class TestCategoryPageHandler:
         # Property 1b: All expected articles should be found
         missing_articles = expected_articles - discovered_articles
         assert len(missing_articles) == 0, f"Missing articles: {missing_articles}"
-        
-        # Property 1c: No duplicates in discovered URLs
-        assert len(discovered_urls) == len(set(discovered_urls)), "Duplicate URLs found"
-        
-        # Property 1d: All discovered URLs should be valid Wikipedia URLs
-        for url in discovered_urls:
-            assert url.startswith('https://'), f"Non-HTTPS URL: {url}"
-            assert 'wikipedia.org' in url, f"Non-Wikipedia URL: {url}"
-            assert '/wiki/' in url, f"Invalid wiki URL: {url}"
-        
-        # Property 1e: No invalid URLs should be included
-        for url in discovered_urls:
-            # Should not contain special pages
-            invalid_patterns = ['/Special:', '/Help:', '/Template:', '/User:', '/Talk:']
-            assert not any(pattern in url for pattern in invalid_patterns), \
-                f"Invalid URL pattern found: {url}"
     
     @given(st.text(min_size=1, max_size=200, alphabet=st.characters(
         whitelist_categories=['Lu', 'Ll', 'Nd', 'Pc'], 
@@ -188,7 +207,7 @@ class TestCategoryPageHandler:
         """Test that title extraction handles various title formats correctly."""
         assume(len(title_text.strip()) > 0)
         # Avoid titles that would result in empty filenames after sanitization
-        assume(not all(c in '_-. ()[]' for c in title_text))
+        assume(title_text.translate(_FILLER))
         
         # Create minimal HTML with title
         html = f'''
@@ -241,18 +260,18 @@ class TestCategoryPageHandler:
         assert result.success
         discovered_urls = result.discovered_urls or []
         
-        # Count subcategories and articles
-        subcategories = [url for url in discovered_urls if '/Category:' in url]
-        articles = [url for url in discovered_urls if '/Category:' not in url]
+        # Count subcategories and articles in one pass
+        subcategory_count = sum('/Category:' in url for url in discovered_urls)
+        article_count = len(discovered_urls) - subcategory_count
         
         # Articles should always be included
-        assert len(articles) == 1
+        assert article_count == 1
         
         # Subcategories should only be included if depth < max_depth
         if depth < self.handler.max_depth:
-            assert len(subcategories) == 2, f"Expected 2 subcategories at depth {depth}"
+            assert subcategory_count == 2, f"Expected 2 subcategories at depth {depth}"
         else:
-            assert len(subcategories) == 0, f"Expected 0 subcategories at depth {depth}"
+            assert subcategory_count == 0, f"Expected 0 subcategories at depth {depth}"
     
     @given(wikipedia_urls())
     @settings(max_examples=30)
@@ -276,29 +295,57 @@ class TestCategoryPageHandler:
         # Non-Wikipedia should be invalid
         assert not self.handler._is_valid_wikipedia_url(invalid_variants[1])
     
-    def test_malformed_html_handling(self):
+    @pytest.mark.parametrize("html", MALFORMED_HTML, ids=MALFORMED_HTML_IDS)
+    def test_malformed_html_handling(self, html):
         """Test handling of malformed or incomplete HTML."""
-        malformed_htmls = [
-            "",  # Empty content
-            "<html><body></body></html>",  # No category content
-            "<html><body><h1>No ID</h1></body></html>",  # Missing required elements
-            "<html><body><div>Broken HTML",  # Unclosed tags
-            "Not HTML at all",  # Plain text
-        ]
+        result = self.handler.process_category(
+            url="https://en.wikipedia.org/wiki/Category:Test",
+            content=html,
+            depth=0
+        )
         
-        for html in malformed_htmls:
-            result = self.handler.process_category(
-                url="https://en.wikipedia.org/wiki/Category:Test",
-                content=html,
-                depth=0
-            )
-            
-            # Should not crash, but may succeed with empty results
-            assert isinstance(result.success, bool)
-            if result.success:
-                # If successful, should have valid structure
-                assert isinstance(result.discovered_urls, list)
-                assert isinstance(result.data, dict)
+        # Should not crash, but may succeed with empty results
+        assert isinstance(result.success, bool)
+        if result.success:
+            # If successful, should have valid structure
+            assert isinstance(result.discovered_urls, list)
+            assert isinstance(result.data, dict)
+    
+    def test_links_outside_content_regions_found(self):
+        """Test that category links outside mw-content-text are still discovered."""
+        html = '''
+        <html>
+        <body>
+        <h1 id="firstHeading">Category:Singapore</h1>
+        <div class="CategoryTreeTag">
+        <a href="/wiki/Category:Singapore_culture">Singapore culture</a>
+        </div>
+        <h2>Subcategories</h2>
+        <ul><li><a href="/wiki/Category:Singapore_history">Singapore history</a></li></ul>
+        <h2>Pages in category "Singapore"</h2>
+        <ul><li><a href="/wiki/Merlion">Merlion</a></li></ul>
+        <div id="mw-content-text">
+        <div id="mw-pages"><a href="/wiki/Singapore">Singapore</a></div>
+        </div>
+        </body>
+        </html>
+        '''
+        url = "https://en.wikipedia.org/wiki/Category:Singapore"
+        
+        parsed = self.handler.process_category(url=url, content=html, depth=0)
+        from_dom = self.handler.process_category(
+            url=url, content=html, depth=0, dom=BeautifulSoup(html, 'html.parser')
+        )
+        
+        assert parsed.success and from_dom.success
+        assert set(parsed.discovered_urls) == {
+            "https://en.wikipedia.org/wiki/Category:Singapore_culture",
+            "https://en.wikipedia.org/wiki/Category:Singapore_history",
+            "https://en.wikipedia.org/wiki/Merlion",
+            "https://en.wikipedia.org/wiki/Singapore",
+        }
+        assert parsed.discovered_urls == from_dom.discovered_urls
+        assert parsed.data == from_dom.data
     
     def test_file_storage_integration(self):
         """Test integration with FileStorage for saving category data."""
@@ -328,9 +375,7 @@ class TestCategoryPageHandler:
         assert len(saved_files) == 1
         
         # Verify file content
-        import json
-        with open(saved_files[0], 'r', encoding='utf-8') as f:
-            saved_data = json.load(f)
+        saved_data = orjson.loads(saved_files[0].read_bytes())
         
         assert saved_data['title'] == 'Singapore'
         assert saved_data['type'] == 'category'
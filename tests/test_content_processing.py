@@ -1,13 +1,31 @@
 """Property-based tests for content processing."""
 
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from hypothesis import given, strategies as st, assume
 from hypothesis.strategies import composite
 import pytest
+from bs4 import BeautifulSoup
+from unittest.mock import patch
 
 from wikipedia_crawler.processors import ContentProcessor
 
 
+# Patterns checked against processed output, compiled once for all examples
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_LIST_RE = re.compile(r'[-*]|\d+\.|^\s*\w', re.MULTILINE)
+_MARKDOWN_LINK_RE = re.compile(r'\[.*?\]\(.*?\)')
+_EXCESS_NEWLINES_RE = re.compile(r'\n{4,}')
+_UNWANTED_RES = [re.compile(p, re.IGNORECASE) for p in [
+    r'\[edit\]',           # Edit links
+    r'\[\d+\]',            # Citation numbers
+    r'infobox',            # Infobox remnants
+    r'navbox',             # Navigation box remnants
+    r'reflist',            # Reference list remnants
+]]
+
+
 # Custom strategies for generating test data
 @composite
 def html_content(draw):
@@ -115,8 +133,7 @@ class TestContentProcessing:
         result = processor.process_content(html_input)
         
         # Should not contain HTML tags
-        html_tag_pattern = re.compile(r'<[^>]+>')
-        html_tags = html_tag_pattern.findall(result)
+        html_tags = _HTML_TAG_RE.findall(result)
         
         assert len(html_tags) == 0, f"Found HTML tags in processed content: {html_tags}"
     
@@ -134,17 +151,9 @@ class TestContentProcessing:
         result = processor.process_content(html_input)
         
         # Should not contain Wikipedia-specific unwanted elements
-        unwanted_patterns = [
-            r'\[edit\]',           # Edit links
-            r'\[\d+\]',            # Citation numbers
-            r'infobox',            # Infobox remnants
-            r'navbox',             # Navigation box remnants
-            r'reflist',            # Reference list remnants
-        ]
-        
-        for pattern in unwanted_patterns:
-            matches = re.findall(pattern, result, re.IGNORECASE)
-            assert len(matches) == 0, f"Found unwanted pattern '{pattern}' in result: {matches}"
+        for pattern in _UNWANTED_RES:
+            matches = pattern.findall(result)
+            assert len(matches) == 0, f"Found unwanted pattern '{pattern.pattern}' in result: {matches}"
     
     @given(html_input=html_content())
     def test_content_processing_preserves_text_structure(self, html_input):
@@ -168,13 +177,12 @@ class TestContentProcessing:
         # If input had lists, output should preserve list-like structure
         if '<ul>' in html_input or '<ol>' in html_input:
             # Should have list markers, line breaks, or preserved content structure
-            list_pattern = re.compile(r'[-*]|\d+\.|^\s*\w', re.MULTILINE)
-            assert list_pattern.search(result), f"Lists should preserve some structural elements. Result: '{result}'"
+            assert _LIST_RE.search(result), f"Lists should preserve some structural elements. Result: '{result}'"
         
         # If input had links, output should preserve link content or structure
         if '<a href=' in html_input:
             # Should have markdown links or at least preserve the link text/URL
-            has_links = (re.search(r'\[.*?\]\(.*?\)', result) or 
+            has_links = (_MARKDOWN_LINK_RE.search(result) or 
                         '/wiki/' in result or 
                         'http' in result)
             assert has_links, "Links should preserve URL or link text content"
@@ -239,7 +247,7 @@ class TestContentProcessing:
         
         if result.strip():  # Only test non-empty results
             # Should not have excessive whitespace
-            assert not re.search(r'\n{4,}', result), "Should not have more than 3 consecutive newlines"
+            assert not _EXCESS_NEWLINES_RE.search(result), "Should not have more than 3 consecutive newlines"
             
             # Should not have trailing whitespace on lines
             lines = result.split('\n')
@@ -283,6 +291,21 @@ class TestContentProcessing:
         assert isinstance(stats['has_lists'], bool)
         assert isinstance(stats['has_links'], bool)
     
+    @given(html_input=wikipedia_html())
+    def test_process_soup_matches_process_content(self, html_input):
+        """
+        Property 2: Content Processing Round Trip - Pre-parsed input
+        For any HTML input, processing a pre-parsed tree should match processing the string.
+        **Feature: wikipedia-singapore-crawler, Property 2: Content Processing Round Trip**
+        **Validates: Requirements 2.2, 2.3, 9.1, 9.2, 9.3, 9.4, 9.5**
+        """
+        assume(html_input.strip())
+        
+        processor = ContentProcessor()
+        soup = BeautifulSoup(html_input, 'html.parser')
+        
+        assert processor.process_soup(soup) == processor.process_content(html_input)
+    
     def test_empty_content_handling(self):
         """Test handling of empty and whitespace-only content."""
         processor = ContentProcessor()
@@ -302,6 +325,23 @@ class TestContentProcessing:
             # Either exception is acceptable for None input
             pass
     
+    def test_nested_media_links_removed(self):
+        """Test that file links nested inside removed links or media do not break processing."""
+        processor = ContentProcessor()
+        
+        html = (
+            '<p>Intro text about Singapore.'
+            '<a href="/wiki/File:Flag.svg">flag <a href="/wiki/Image:Map.png">map</a></a>'
+            '<figure><a href="/wiki/File:Skyline.jpg"><img src="skyline.jpg"></a></figure>'
+            '</p>'
+        )
+        
+        result = processor.process_content(html)
+        
+        assert 'Intro text about Singapore.' in result
+        assert 'File:' not in result
+        assert 'Image:' not in result
+    
     def test_real_wikipedia_content_processing(self):
         """Test with realistic Wikipedia content."""
         processor = ContentProcessor()
@@ -341,6 +381,68 @@ class TestContentProcessing:
         assert '**Singapore**' in result or '*Singapore*' in result  # Bold formatting
         assert '#' in result  # Headers converted
 
+    def test_repeated_content_not_reparsed(self):
+        """Test that processing the same page again reuses the previous result."""
+        processor = ContentProcessor()
+        html = '<p>Singapore is a sovereign city-state in Southeast Asia.</p>'
+        
+        with patch('wikipedia_crawler.processors.content_processor.BeautifulSoup',
+                   wraps=BeautifulSoup) as mock_parser:
+            first = processor.process_content(html)
+            second = processor.process_content(html)
+            other = processor.process_content('<p>A different page.</p>')
+        
+        assert first == second
+        assert 'different page' in other
+        assert mock_parser.call_count == 2
+    
+    def test_large_page_sliced_to_main_content(self):
+        """Test that oversized full pages are parsed from mw-content-text only."""
+        processor = ContentProcessor(max_full_parse_size=100)
+        
+        page_html = (
+            '<html><body>'
+            '<div id="mw-panel"><p>Sidebar portal text</p></div>'
+            '<div id="mw-content-text" class="mw-body-content">'
+            '<div class="mw-parser-output"><p>Singapore is a city-state.</p>'
+            '<!-- \nNewPP limit report\nCPU time usage: 0.1 seconds\n-->'
+            '</div></div>'
+            '<div id="catlinks" class="catlinks"><p>Category footer</p></div>'
+            '</body></html>'
+        )
+        
+        result = processor.process_content(page_html)
+        assert 'Singapore is a city-state.' in result
+        assert 'Sidebar portal text' not in result
+        
+        # Below the limit the whole page is still parsed
+        unsliced = ContentProcessor().process_content(page_html)
+        assert 'Sidebar portal text' in unsliced
+        
+        # Without MediaWiki markers there is nothing to slice on
+        plain_html = '<p>Sidebar portal text</p>' * 10
+        assert 'Sidebar portal text' in processor.process_content(plain_html)
+    
+    def test_shared_processor_keeps_per_thread_state(self):
+        """Test that threads sharing a processor use their own converter and cache."""
+        processor = ContentProcessor()
+        pages = [f'<p>Article number {i} about Singapore.</p>' for i in range(8)]
+        barrier = threading.Barrier(len(pages))
+        
+        def process(html):
+            barrier.wait()  # Make every thread process at the same time
+            return processor.process_content(html), processor._get_markdown_converter()
+        
+        with ThreadPoolExecutor(max_workers=len(pages)) as executor:
+            results = list(executor.map(process, pages))
+        
+        for i, (result, _) in enumerate(results):
+            assert f'Article number {i} about Singapore.' in result
+        assert len({id(converter) for _, converter in results}) == len(pages)
+        
+        # This thread has not processed anything, so nothing is cached for it
+        assert getattr(processor._local, 'last_processed', None) is None
+
 
 if __name__ == "__main__":
     # Run a quick test to verify the test setup works
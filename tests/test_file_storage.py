@@ -161,6 +161,21 @@ class TestFileStorage:
         assert "category_Singapore.json" in existing
         assert "Singapore.json" in existing
     
+    def test_existing_files_loaded_from_disk(self):
+        """Test that JSON files already on disk are found recursively."""
+        root = Path(self.temp_dir)
+        (root / "History").mkdir()
+        (root / "History" / "Raffles.json").write_text("{}", encoding="utf-8")
+        (root / "category_Singapore.json").write_text("{}", encoding="utf-8")
+        (root / "notes.txt").write_text("ignored", encoding="utf-8")
+        (root / "folder.json").mkdir()
+        
+        storage = FileStorage(root)
+        
+        existing = storage.get_existing_files()
+        assert existing == {str(Path("History") / "Raffles.json"), "category_Singapore.json"}
+        assert storage.get_storage_stats()['total_size_bytes'] == 4
+    
     def test_storage_statistics(self):
         """Test storage statistics functionality."""
         # Initial stats
@@ -0,0 +1,38 @@
+"""Tests for the shared HTTP session utilities."""
+
+import requests
+
+from wikipedia_crawler.utils import create_session, get_session
+
+
+class TestHttpClient:
+    """Test cases for HTTP session creation."""
+    
+    def test_create_session_pool_configuration(self):
+        """Test that new sessions mount a pooled adapter without retries."""
+        session = create_session(pool_connections=4, pool_maxsize=8)
+        
+        adapter = session.get_adapter('https://en.wikipedia.org/wiki/Singapore')
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 8
+        assert adapter.max_retries.total == 0
+        assert session.headers['Connection'] == 'keep-alive'
+        
+        session.close()
+    
+    def test_create_session_returns_new_instances(self):
+        """Test that create_session does not share state between callers."""
+        first = create_session()
+        second = create_session()
+        
+        assert first is not second
+        
+        first.close()
+        second.close()
+    
+    def test_get_session_is_shared(self):
+        """Test that get_session returns the same session on every call."""
+        session = get_session()
+        
+        assert isinstance(session, requests.Session)
+        assert get_session() is session
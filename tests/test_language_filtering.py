@@ -4,6 +4,7 @@ import re
 from hypothesis import given, strategies as st, assume
 from hypothesis.strategies import composite
 import pytest
+from unittest.mock import patch
 
 from wikipedia_crawler.processors import LanguageFilter
 
@@ -352,6 +353,20 @@ class TestLanguageFiltering:
         should_process, detected_lang = language_filter.filter_content('123 !@# 456', '')
         assert detected_lang == 'unknown'
     
+    def test_repeated_content_detected_once(self):
+        """Test that detecting the same content again reuses the earlier result."""
+        language_filter = LanguageFilter()
+        content = "Singapore is a sovereign island country and city-state in Southeast Asia."
+        
+        with patch.object(language_filter, '_detect_language_with_langdetect',
+                          wraps=language_filter._detect_language_with_langdetect) as langdetect_mock:
+            first = language_filter.filter_content(content, '')
+            second = language_filter.filter_content(content, '')
+        
+        assert first == second
+        assert langdetect_mock.call_count == 1
+        assert language_filter.get_language_stats()[first[1]] == 2
+    
     def test_language_normalization_consistency(self):
         """Test language code normalization."""
         language_filter = LanguageFilter()
@@ -111,7 +111,7 @@ class TestRecursiveProcessingCompleteness:
                 return result
             
             # Mock category handler to return discovered URLs
-            def mock_process_category(url, content, depth):
+            def mock_process_category(url, content, depth, dom=None):
                 """Mock category processing that returns the expected subcategories and articles."""
                 result = Mock()
                 result.success = True
@@ -133,7 +133,7 @@ class TestRecursiveProcessingCompleteness:
                 return result
             
             # Mock article handler to simulate successful processing
-            def mock_process_article(url, content):
+            def mock_process_article(url, content, dom=None):
                 """Mock article processing that always succeeds."""
                 result = Mock()
                 result.success = True
@@ -268,7 +268,7 @@ class TestRecursiveProcessingCompleteness:
                 result.content = self._generate_category_html(url, {'root': url})
                 return result
             
-            def mock_process_category(url, content, depth):
+            def mock_process_category(url, content, depth, dom=None):
                 result = Mock()
                 result.success = True
                 result.url = url
@@ -339,7 +339,7 @@ class TestRecursiveProcessingCompleteness:
                 
                 return result
             
-            def mock_process_category(url, content, depth):
+            def mock_process_category(url, content, depth, dom=None):
                 result = Mock()
                 result.success = True
                 result.url = url
@@ -361,7 +361,7 @@ class TestRecursiveProcessingCompleteness:
                 result.discovered_urls = discovered_urls
                 return result
             
-            def mock_process_article(url, content):
+            def mock_process_article(url, content, dom=None):
                 result = Mock()
                 result.success = True
                 result.url = url
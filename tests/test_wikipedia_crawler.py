@@ -142,6 +142,108 @@ class TestWikipediaCrawler:
             assert not crawler._running
             assert crawler._crawl_thread is None
     
+    @patch('wikipedia_crawler.core.wikipedia_crawler.WikipediaCrawler._process_url')
+    def test_wait_for_completion(self, mock_process_url):
+        """Test waiting for the crawl loop to finish."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            crawler = WikipediaCrawler(
+                start_url="https://en.wikipedia.org/wiki/Category:Singapore",
+                output_dir=temp_dir
+            )
+            
+            # Nothing has finished yet
+            assert not crawler.wait_for_completion(timeout=0.01)
+            
+            crawler.start_crawling()
+            assert not crawler.wait_for_completion(timeout=0.01)
+            
+            # Stopping should release waiters
+            crawler.stop_crawling()
+            assert crawler.wait_for_completion(timeout=1)
+    
+    @patch('wikipedia_crawler.core.wikipedia_crawler.WikipediaCrawler._process_url')
+    def test_request_stop(self, mock_process_url):
+        """Test that request_stop returns at once and the crawl loop then finishes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            crawler = WikipediaCrawler(
+                start_url="https://en.wikipedia.org/wiki/Category:Singapore",
+                output_dir=temp_dir
+            )
+            
+            crawler.start_crawling()
+            assert not crawler.wait_for_completion(timeout=0.01)
+            
+            # Only flags the loop; it stops on its own and releases waiters
+            crawler.request_stop()
+            assert crawler._shutdown_requested
+            assert crawler.wait_for_completion(timeout=10)
+            assert not crawler.get_status().is_running
+    
+    @patch('wikipedia_crawler.core.wikipedia_crawler.time.sleep')
+    @patch('wikipedia_crawler.core.wikipedia_crawler.WikipediaCrawler._process_url')
+    def test_multiple_workers_drain_queue(self, mock_process_url, mock_sleep):
+        """Test that concurrent workers process every queued URL exactly once."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            crawler = WikipediaCrawler(
+                start_url="https://en.wikipedia.org/wiki/Category:Singapore",
+                output_dir=temp_dir,
+                max_workers=3
+            )
+            
+            urls = [f"https://en.wikipedia.org/wiki/Article_{i}" for i in range(6)]
+            for url in urls:
+                crawler.url_queue.add_url(url, URLType.ARTICLE, depth=0)
+            
+            crawler.start_crawling()
+            assert crawler.wait_for_completion(timeout=10)
+            
+            processed = sorted(call.args[0].url for call in mock_process_url.call_args_list)
+            assert processed == sorted(urls)
+            assert crawler._active_workers == 0
+    
+    @patch('wikipedia_crawler.core.wikipedia_crawler.time.sleep')
+    def test_multiple_workers_count_and_save_once(self, mock_sleep):
+        """Test that workers never lose session counts or repeat periodic saves."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            crawler = WikipediaCrawler(
+                start_url="https://en.wikipedia.org/wiki/Category:Singapore",
+                output_dir=temp_dir,
+                max_workers=4
+            )
+            
+            urls = [f"https://en.wikipedia.org/wiki/Article_{i}" for i in range(25)]
+            for url in urls:
+                crawler.url_queue.add_url(url, URLType.ARTICLE, depth=0)
+            
+            def count_url(url_item):
+                crawler._increment_session_stat('urls_processed_this_session')
+            
+            with patch.object(crawler, '_process_url', side_effect=count_url), \
+                 patch.object(crawler, '_save_state') as mock_save:
+                crawler.start_crawling()
+                assert crawler.wait_for_completion(timeout=10)
+            
+            assert crawler._session_stats['urls_processed_this_session'] == 25
+            # Two periodic saves (after 10 and 20 URLs) plus the final one
+            assert mock_save.call_count == 3
+    
+    def test_worker_exception_reaches_crawl_loop(self):
+        """Test that an exception escaping a worker is not silently dropped."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            crawler = WikipediaCrawler(
+                start_url="https://en.wikipedia.org/wiki/Category:Singapore",
+                output_dir=temp_dir,
+                max_workers=2
+            )
+            
+            with patch.object(crawler, '_process_queue', side_effect=RuntimeError("worker died")), \
+                 patch.object(crawler.logger, 'error') as mock_error:
+                crawler.start_crawling()
+                assert crawler.wait_for_completion(timeout=10)
+            
+            messages = [call.args[0] for call in mock_error.call_args_list]
+            assert any("worker died" in message for message in messages)
+    
     def test_start_crawling_already_running(self):
         """Test starting crawler when already running."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -12,6 +12,17 @@ from datetime import datetime
 import re
 
 
+SINGAPORE_KEYWORDS = (
+    'singapore', 'singaporean', 'spore', 'sg',
+    'marina bay', 'changi', 'orchard road', 'sentosa',
+    'merlion', 'raffles', 'lee kuan yew', 'pap',
+    'hdb', 'mrt', 'cpf', 'nus', 'ntu', 'smu'
+)
+
+# All keywords in one alternation so the text is scanned once, not once per keyword
+_SINGAPORE_KEYWORD_RE = re.compile('|'.join(map(re.escape, SINGAPORE_KEYWORDS)))
+
+
 class SingaporeFileValidator:
     """Validates Singapore Wikipedia crawl files."""
     
@@ -209,21 +220,10 @@ class SingaporeFileValidator:
         Returns:
             True if Singapore-related, False otherwise
         """
-        singapore_keywords = [
-            'singapore', 'singaporean', 'spore', 'sg',
-            'marina bay', 'changi', 'orchard road', 'sentosa',
-            'merlion', 'raffles', 'lee kuan yew', 'pap',
-            'hdb', 'mrt', 'cpf', 'nus', 'ntu', 'smu'
-        ]
-        
         text_to_check = (title + ' ' + content).lower()
         
         # Check for Singapore keywords
-        for keyword in singapore_keywords:
-            if keyword in text_to_check:
-                return True
-        
-        return False
+        return _SINGAPORE_KEYWORD_RE.search(text_to_check) is not None
     
     def _calculate_statistics(self) -> None:
         """Calculate additional statistics from validation results."""
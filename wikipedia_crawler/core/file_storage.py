@@ -2,6 +2,7 @@
 
 import json
 import logging
+import os
 import tempfile
 from pathlib import Path
 from typing import Set, Optional, Dict, Any
@@ -219,12 +220,14 @@ class FileStorage:
             category_files = sum(1 for f in self._existing_files if f.startswith('category_'))
             article_files = total_files - category_files
             
-            # Calculate total size
+            # Calculate total size with one stat() per file; a missing file
+            # raises instead of needing a separate exists() check
             total_size = 0
             for filename in self._existing_files:
-                file_path = self.output_dir / filename
-                if file_path.exists():
-                    total_size += file_path.stat().st_size
+                try:
+                    total_size += os.stat(os.path.join(self.output_dir, filename)).st_size
+                except OSError:
+                    continue
             
             return {
                 'total_files': total_files,
@@ -319,12 +322,19 @@ class FileStorage:
         """Load existing files from the output directory."""
         try:
             if self.output_dir.exists():
-                # Recursively find all JSON files
-                for file_path in self.output_dir.rglob('*.json'):
-                    if file_path.is_file():
-                        # Store relative path from output_dir for uniqueness checking
-                        relative_path = file_path.relative_to(self.output_dir)
-                        self._existing_files.add(str(relative_path))
+                # Recursively find all JSON files; scandir entries carry the
+                # file type, so no extra stat() is needed per file
+                pending = [(self.output_dir, '')]
+                while pending:
+                    directory, prefix = pending.pop()
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            # Store relative path from output_dir for uniqueness checking
+                            relative_path = os.path.join(prefix, entry.name) if prefix else entry.name
+                            if entry.is_dir():
+                                pending.append((entry.path, relative_path))
+                            elif entry.name.endswith('.json') and entry.is_file():
+                                self._existing_files.add(relative_path)
                 
                 self.logger.debug(f"Loaded {len(self._existing_files)} existing files")
             else:
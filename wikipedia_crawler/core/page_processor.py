@@ -1,6 +1,7 @@
 """Base page processor for handling Wikipedia page requests and routing."""
 
 import time
+import threading
 import requests
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
@@ -8,6 +9,8 @@ from enum import Enum
 from bs4 import BeautifulSoup
 
 from wikipedia_crawler.models.data_models import ProcessResult, URLType
+from wikipedia_crawler.utils.html_parser import HTML_PARSER
+from wikipedia_crawler.utils.http_client import create_session
 import logging
 
 
@@ -49,8 +52,8 @@ class PageProcessor:
         self.max_retries = max_retries
         self.timeout = timeout
         
-        # HTTP session configuration
-        self.session = requests.Session()
+        # HTTP session configuration (pooled keep-alive connections)
+        self.session = create_session()
         self.headers = {
             'User-Agent': user_agent or 'WikipediaCrawler/1.0 (Educational Research Project; Contact: researcher@example.com)',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -62,10 +65,15 @@ class PageProcessor:
         }
         self.session.headers.update(self.headers)
         
-        # Track request timing for rate limiting
+        # Track request timing for rate limiting (shared by worker threads)
         self._last_request_time = 0.0
+        self._rate_limit_lock = threading.Lock()
         
-        # Statistics
+        # Only one worker at a time may prompt on the console
+        self._prompt_lock = threading.Lock()
+        
+        # Statistics (updated by worker threads, so only under _stats_lock)
+        self._stats_lock = threading.Lock()
         self._stats = {
             'requests_made': 0,
             'successful_requests': 0,
@@ -114,17 +122,18 @@ class PageProcessor:
                     url=url
                 )
             
-            # Parse content
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Parse content once, with the parser the page handlers use, so the
+            # tree handed on to them matches what they would build themselves
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             
             # Determine page type
-            page_type = self._determine_page_type(response.text, url)
+            page_type = self._determine_page_type(response.text, url, soup)
             
             # Update statistics
             if page_type == PageType.CATEGORY:
-                self._stats['categories_processed'] += 1
+                self._increment_stat('categories_processed')
             elif page_type == PageType.ARTICLE:
-                self._stats['articles_processed'] += 1
+                self._increment_stat('articles_processed')
             
             # Create successful result
             result = ProcessResult(
@@ -134,7 +143,8 @@ class PageProcessor:
                 page_type=page_type.value,
                 status_code=response.status_code,
                 content_length=len(response.text),
-                response_headers=dict(response.headers)
+                response_headers=dict(response.headers),
+                parsed_dom=soup
             )
             
             self.logger.debug(f"Successfully processed {page_type.value} page: {url}")
@@ -142,7 +152,7 @@ class PageProcessor:
             
         except Exception as e:
             self.logger.error(f"Error processing page {url}: {e}")
-            self._stats['failed_requests'] += 1
+            self._increment_stat('failed_requests')
             
             return ProcessResult(
                 success=False,
@@ -170,50 +180,50 @@ class PageProcessor:
                 self.logger.debug(f"Fetching {url} (attempt {attempt + 1}/{self.max_retries + 1})")
                 
                 response = self.session.get(url, timeout=self.timeout)
-                self._stats['requests_made'] += 1
+                self._increment_stat('requests_made')
                 
                 # Check for successful response
                 if response.status_code == 200:
-                    self._stats['successful_requests'] += 1
+                    self._increment_stat('successful_requests')
                     self.logger.debug(f"Successfully fetched {url} ({len(response.text)} bytes)")
                     return response
                 else:
                     self.logger.warning(f"HTTP {response.status_code} for URL: {url}")
-                    self._stats['failed_requests'] += 1
+                    self._increment_stat('failed_requests')
                     
                     # Don't retry for certain status codes (permanent failures)
                     if response.status_code in [404, 403, 410, 451]:  # Not found, forbidden, gone, unavailable for legal reasons
                         self.logger.info(f"Permanent failure HTTP {response.status_code} for URL: {url} - giving up")
-                        self._stats['permanent_failures'] += 1
+                        self._increment_stat('permanent_failures')
                         return None
                     
                     # Don't retry for client errors (4xx) except rate limiting
                     if 400 <= response.status_code < 500 and response.status_code not in [429, 408]:  # Rate limit, timeout
                         self.logger.info(f"Client error HTTP {response.status_code} for URL: {url} - giving up")
-                        self._stats['client_errors'] += 1
+                        self._increment_stat('client_errors')
                         return None
                     
                     last_exception = requests.HTTPError(f"HTTP {response.status_code}")
                     
             except requests.exceptions.ConnectionError as e:
                 self.logger.warning(f"Connection error for URL {url}: {e}")
-                self._stats['connection_errors'] += 1
+                self._increment_stat('connection_errors')
                 last_exception = e
                 
             except requests.exceptions.Timeout as e:
                 self.logger.warning(f"Timeout for URL {url}: {e}")
-                self._stats['timeout_errors'] += 1
+                self._increment_stat('timeout_errors')
                 last_exception = e
                 
             except requests.exceptions.TooManyRedirects as e:
                 self.logger.warning(f"Too many redirects for URL {url}: {e}")
-                self._stats['redirect_errors'] += 1
+                self._increment_stat('redirect_errors')
                 # Don't retry redirect loops
                 return None
                 
             except (requests.RequestException, Exception) as e:
                 self.logger.warning(f"Request failed for URL {url}: {e}")
-                self._stats['other_errors'] += 1
+                self._increment_stat('other_errors')
                 last_exception = e
             
             # Wait before retry (exponential backoff with jitter)
@@ -224,7 +234,7 @@ class PageProcessor:
                 wait_time = base_wait + jitter
                 self.logger.debug(f"Waiting {wait_time:.1f}s before retry...")
                 time.sleep(wait_time)
-                self._stats['retries_attempted'] += 1
+                self._increment_stat('retries_attempted')
         
         # All retries failed - check network connectivity and ask user
         return self._handle_failed_url_with_connectivity_check(url, last_exception)
@@ -252,18 +262,19 @@ class PageProcessor:
             user_retry_cycle = 0
             
             while user_retry_cycle < max_user_retry_cycles:
-                user_choice = self._prompt_user_for_action(url, user_retry_cycle + 1, max_user_retry_cycles)
+                with self._prompt_lock:
+                    user_choice = self._prompt_user_for_action(url, user_retry_cycle + 1, max_user_retry_cycles)
                 
                 if user_choice.lower() == 'skip':
                     self.logger.info(f"User chose to skip URL: {url}")
-                    self._stats['skipped_urls'] = self._stats.get('skipped_urls', 0) + 1
-                    self._stats['total_failures'] += 1
+                    self._increment_stat('skipped_urls')
+                    self._increment_stat('total_failures')
                     return None
                     
                 elif user_choice.lower() == 'continue':
                     user_retry_cycle += 1
                     self.logger.info(f"User chose to retry URL: {url} (cycle {user_retry_cycle}/{max_user_retry_cycles})")
-                    self._stats['user_retries'] = self._stats.get('user_retries', 0) + 1
+                    self._increment_stat('user_retries')
                     
                     # Retry the URL with full retry logic
                     retry_result = self._retry_url_after_user_choice(url)
@@ -275,9 +286,9 @@ class PageProcessor:
                         if user_retry_cycle >= max_user_retry_cycles:
                             self.logger.warning(f"Maximum user retry cycles ({max_user_retry_cycles}) reached for URL: {url} - forcing skip")
                             print(f"\n⚠️  Maximum retry attempts ({max_user_retry_cycles}) reached. Automatically skipping URL to prevent infinite loop.")
-                            self._stats['skipped_urls'] = self._stats.get('skipped_urls', 0) + 1
-                            self._stats['total_failures'] += 1
-                            self._stats['circuit_breaker_activations'] = self._stats.get('circuit_breaker_activations', 0) + 1
+                            self._increment_stat('skipped_urls')
+                            self._increment_stat('total_failures')
+                            self._increment_stat('circuit_breaker_activations')
                             return None
                         else:
                             self.logger.warning("Retry failed and connectivity test still fails - prompting user again")
@@ -285,7 +296,7 @@ class PageProcessor:
                     else:
                         # Connectivity is good but URL still fails - treat as permanent failure
                         self.logger.info(f"Connectivity restored but URL still fails - treating as permanent failure: {url}")
-                        self._stats['total_failures'] += 1
+                        self._increment_stat('total_failures')
                         return None
                 else:
                     print("Invalid choice. Please enter 'continue' or 'skip'.")
@@ -293,14 +304,14 @@ class PageProcessor:
             # Circuit breaker triggered - force skip
             self.logger.warning(f"Circuit breaker triggered: Maximum user retry cycles ({max_user_retry_cycles}) reached for URL: {url}")
             print(f"\n🛑 Circuit breaker activated: Maximum retry cycles reached. Automatically skipping URL.")
-            self._stats['skipped_urls'] = self._stats.get('skipped_urls', 0) + 1
-            self._stats['total_failures'] += 1
-            self._stats['circuit_breaker_activations'] = self._stats.get('circuit_breaker_activations', 0) + 1
+            self._increment_stat('skipped_urls')
+            self._increment_stat('total_failures')
+            self._increment_stat('circuit_breaker_activations')
             return None
         else:
             # Network connectivity is good but URL still fails - treat as permanent failure
             self.logger.info(f"Network connectivity is good but URL still fails - treating as permanent failure: {url}")
-            self._stats['total_failures'] += 1
+            self._increment_stat('total_failures')
             return None
     
     def _test_network_connectivity(self) -> bool:
@@ -315,19 +326,19 @@ class PageProcessor:
             response = self.session.get("https://www.google.com", timeout=10)
             success = response.status_code == 200
             
-            self._stats['connectivity_tests'] = self._stats.get('connectivity_tests', 0) + 1
+            self._increment_stat('connectivity_tests')
             if success:
-                self._stats['connectivity_successes'] = self._stats.get('connectivity_successes', 0) + 1
+                self._increment_stat('connectivity_successes')
                 self.logger.debug("Network connectivity test successful")
             else:
-                self._stats['connectivity_failures'] = self._stats.get('connectivity_failures', 0) + 1
+                self._increment_stat('connectivity_failures')
                 self.logger.warning(f"Network connectivity test failed with status: {response.status_code}")
             
             return success
             
         except Exception as e:
-            self._stats['connectivity_tests'] = self._stats.get('connectivity_tests', 0) + 1
-            self._stats['connectivity_failures'] = self._stats.get('connectivity_failures', 0) + 1
+            self._increment_stat('connectivity_tests')
+            self._increment_stat('connectivity_failures')
             self.logger.warning(f"Network connectivity test failed with exception: {e}")
             return False
     
@@ -363,15 +374,13 @@ class PageProcessor:
                 choice = input("Enter your choice (continue/skip): ").strip().lower()
                 if choice in ['continue', 'skip']:
                     # Log the user's decision
-                    self._stats['user_decisions'] = self._stats.get('user_decisions', {})
-                    self._stats['user_decisions'][choice] = self._stats['user_decisions'].get(choice, 0) + 1
+                    self._record_user_decision(choice)
                     return choice
                 else:
                     print("Invalid choice. Please enter 'continue' or 'skip'.")
             except (EOFError, KeyboardInterrupt):
                 print("\nReceived interrupt signal. Choosing 'skip' to continue gracefully.")
-                self._stats['user_decisions'] = self._stats.get('user_decisions', {})
-                self._stats['user_decisions']['skip'] = self._stats['user_decisions'].get('skip', 0) + 1
+                self._record_user_decision('skip')
                 return 'skip'
     
     def _retry_url_after_user_choice(self, url: str) -> Optional[requests.Response]:
@@ -391,44 +400,44 @@ class PageProcessor:
                 self.logger.debug(f"User-requested retry for {url} (attempt {attempt + 1}/{self.max_retries + 1})")
                 
                 response = self.session.get(url, timeout=self.timeout)
-                self._stats['requests_made'] += 1
+                self._increment_stat('requests_made')
                 
                 # Check for successful response
                 if response.status_code == 200:
-                    self._stats['successful_requests'] += 1
-                    self._stats['user_retry_successes'] = self._stats.get('user_retry_successes', 0) + 1
+                    self._increment_stat('successful_requests')
+                    self._increment_stat('user_retry_successes')
                     self.logger.info(f"User-requested retry successful for {url}")
                     return response
                 else:
                     self.logger.warning(f"User-requested retry got HTTP {response.status_code} for URL: {url}")
-                    self._stats['failed_requests'] += 1
+                    self._increment_stat('failed_requests')
                     
                     # Don't retry for permanent failures even in user-requested retries
                     if response.status_code in [404, 403, 410, 451]:
                         self.logger.info(f"Permanent failure HTTP {response.status_code} during user retry for URL: {url}")
-                        self._stats['permanent_failures'] += 1
+                        self._increment_stat('permanent_failures')
                         return None
                     
                     if 400 <= response.status_code < 500 and response.status_code not in [429, 408]:
                         self.logger.info(f"Client error HTTP {response.status_code} during user retry for URL: {url}")
-                        self._stats['client_errors'] += 1
+                        self._increment_stat('client_errors')
                         return None
                     
                     last_exception = requests.HTTPError(f"HTTP {response.status_code}")
                     
             except requests.exceptions.ConnectionError as e:
                 self.logger.warning(f"Connection error during user retry for URL {url}: {e}")
-                self._stats['connection_errors'] += 1
+                self._increment_stat('connection_errors')
                 last_exception = e
                 
             except requests.exceptions.Timeout as e:
                 self.logger.warning(f"Timeout during user retry for URL {url}: {e}")
-                self._stats['timeout_errors'] += 1
+                self._increment_stat('timeout_errors')
                 last_exception = e
                 
             except (requests.RequestException, Exception) as e:
                 self.logger.warning(f"Request failed during user retry for URL {url}: {e}")
-                self._stats['other_errors'] += 1
+                self._increment_stat('other_errors')
                 last_exception = e
             
             # Wait before retry (exponential backoff with jitter)
@@ -438,19 +447,21 @@ class PageProcessor:
                 wait_time = base_wait + jitter
                 self.logger.debug(f"Waiting {wait_time:.1f}s before user-requested retry...")
                 time.sleep(wait_time)
-                self._stats['retries_attempted'] += 1
+                self._increment_stat('retries_attempted')
         
         # All user-requested retries failed
         self.logger.error(f"All user-requested retries failed for URL: {url}. Last error: {last_exception}")
         return None
     
-    def _determine_page_type(self, content: str, url: str) -> PageType:
+    def _determine_page_type(self, content: str, url: str,
+                             soup: Optional[BeautifulSoup] = None) -> PageType:
         """
         Determine the type of Wikipedia page based on content and URL.
         
         Args:
             content: HTML content of the page
             url: URL of the page
+            soup: Already-parsed tree of content (parsed here if None)
             
         Returns:
             PageType enum value
@@ -461,7 +472,8 @@ class PageProcessor:
                 return PageType.CATEGORY
             
             # Method 2: Parse content to look for category-specific elements
-            soup = BeautifulSoup(content, 'html.parser')
+            if soup is None:
+                soup = BeautifulSoup(content, HTML_PARSER)
             
             # Look for category page indicators
             category_indicators = [
@@ -535,16 +547,22 @@ class PageProcessor:
         return False
     
     def _enforce_rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        current_time = time.time()
-        time_since_last_request = current_time - self._last_request_time
+        """
+        Enforce rate limiting between requests.
         
-        if time_since_last_request < self.delay_between_requests:
-            sleep_time = self.delay_between_requests - time_since_last_request
+        Each caller reserves the next free request slot under a lock, so
+        concurrent workers still start requests at least
+        delay_between_requests apart.
+        """
+        with self._rate_limit_lock:
+            current_time = time.time()
+            request_time = max(current_time, self._last_request_time + self.delay_between_requests)
+            self._last_request_time = request_time
+        
+        sleep_time = request_time - current_time
+        if sleep_time > 0:
             self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
             time.sleep(sleep_time)
-        
-        self._last_request_time = time.time()
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -553,33 +571,58 @@ class PageProcessor:
         Returns:
             Dictionary with processing statistics
         """
-        return self._stats.copy()
+        with self._stats_lock:
+            stats = self._stats.copy()
+            stats['user_decisions'] = dict(stats.get('user_decisions', {}))
+        return stats
+    
+    def _increment_stat(self, key: str) -> None:
+        """
+        Add one to a statistics counter.
+        
+        Args:
+            key: Name of the counter
+        """
+        with self._stats_lock:
+            self._stats[key] = self._stats.get(key, 0) + 1
+    
+    def _record_user_decision(self, choice: str) -> None:
+        """
+        Count a continue/skip decision made at the retry prompt.
+        
+        Args:
+            choice: The user's choice
+        """
+        with self._stats_lock:
+            decisions = self._stats.setdefault('user_decisions', {})
+            decisions[choice] = decisions.get(choice, 0) + 1
     
     def reset_stats(self) -> None:
         """Reset processing statistics."""
-        self._stats = {
-            'requests_made': 0,
-            'successful_requests': 0,
-            'failed_requests': 0,
-            'retries_attempted': 0,
-            'categories_processed': 0,
-            'articles_processed': 0,
-            'permanent_failures': 0,
-            'client_errors': 0,
-            'connection_errors': 0,
-            'timeout_errors': 0,
-            'redirect_errors': 0,
-            'other_errors': 0,
-            'total_failures': 0,
-            'connectivity_tests': 0,
-            'connectivity_successes': 0,
-            'connectivity_failures': 0,
-            'skipped_urls': 0,
-            'user_retries': 0,
-            'user_retry_successes': 0,
-            'user_decisions': {},
-            'circuit_breaker_activations': 0
-        }
+        with self._stats_lock:
+            self._stats = {
+                'requests_made': 0,
+                'successful_requests': 0,
+                'failed_requests': 0,
+                'retries_attempted': 0,
+                'categories_processed': 0,
+                'articles_processed': 0,
+                'permanent_failures': 0,
+                'client_errors': 0,
+                'connection_errors': 0,
+                'timeout_errors': 0,
+                'redirect_errors': 0,
+                'other_errors': 0,
+                'total_failures': 0,
+                'connectivity_tests': 0,
+                'connectivity_successes': 0,
+                'connectivity_failures': 0,
+                'skipped_urls': 0,
+                'user_retries': 0,
+                'user_retry_successes': 0,
+                'user_decisions': {},
+                'circuit_breaker_activations': 0
+            }
         self.logger.info("Processing statistics reset")
     
     def close(self) -> None:
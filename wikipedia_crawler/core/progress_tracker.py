@@ -1,12 +1,13 @@
 """Progress tracking system for the Wikipedia crawler."""
 
-import json
 import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from collections import defaultdict, deque
 
+import orjson
+
 from wikipedia_crawler.models.data_models import (
     CrawlStatus, ProgressReport, ProcessStatus, URLType
 )
@@ -250,10 +251,10 @@ class ProgressTracker:
                     'version': '1.0'
                 }
             
-            # Atomic write
+            # Atomic write; keep one entry per line so the text fallback in
+            # retry_failed_urls.py can still recover URLs from a damaged file
             temp_file = self.state_file.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(state_data, f, indent=2, ensure_ascii=False)
+            temp_file.write_bytes(orjson.dumps(state_data, option=orjson.OPT_INDENT_2))
             
             temp_file.replace(self.state_file)
             
@@ -278,8 +279,7 @@ class ProgressTracker:
             return False
         
         try:
-            with open(self.state_file, 'r', encoding='utf-8') as f:
-                state_data = json.load(f)
+            state_data = orjson.loads(self.state_file.read_bytes())
             
             with self._lock:
                 # Load status
@@ -3,6 +3,7 @@
 import signal
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse
@@ -39,7 +40,8 @@ class WikipediaCrawler:
                  output_dir: str = "wikipedia_data",
                  max_depth: int = 5,
                  delay_between_requests: float = 1.0,
-                 max_retries: int = 3):
+                 max_retries: int = 3,
+                 max_workers: int = 1):
         """
         Initialize the Wikipedia crawler.
         
@@ -49,10 +51,13 @@ class WikipediaCrawler:
             max_depth: Maximum crawling depth for subcategories
             delay_between_requests: Delay between HTTP requests (seconds)
             max_retries: Maximum retry attempts for failed requests
+            max_workers: Number of worker threads processing URLs concurrently.
+                Request starts are still spaced by delay_between_requests.
         """
         self.start_url = start_url
         self.output_dir = Path(output_dir)
         self.max_depth = max_depth
+        self.max_workers = max(1, max_workers)
         self.logger = get_logger(__name__)
         
         # Validate start URL
@@ -70,6 +75,11 @@ class WikipediaCrawler:
         self._shutdown_requested = False
         self._crawl_thread: Optional[threading.Thread] = None
         self._lock = threading.RLock()
+        self._state_lock = threading.Lock()  # Serializes state file writes
+        self._done_event = threading.Event()  # Set when the crawl loop exits
+        self._active_workers = 0
+        self._processed_any_url = False
+        self._last_periodic_save = 0  # urls_processed_this_session at the last periodic save
         
         # Statistics
         self._session_stats = {
@@ -84,7 +94,8 @@ class WikipediaCrawler:
         
         self.logger.info(f"WikipediaCrawler initialized for: {start_url}")
         self.logger.info(f"Output directory: {self.output_dir}")
-        self.logger.info(f"Max depth: {max_depth}, Delay: {delay_between_requests}s")
+        self.logger.info(f"Max depth: {max_depth}, Delay: {delay_between_requests}s, "
+                         f"Workers: {self.max_workers}")
     
     def _initialize_components(self, delay_between_requests: float, max_retries: int) -> None:
         """Initialize all crawler components."""
@@ -146,6 +157,7 @@ class WikipediaCrawler:
             
             self._running = True
             self._shutdown_requested = False
+            self._done_event.clear()
             
             # Start crawling in a separate thread
             self._crawl_thread = threading.Thread(
@@ -187,6 +199,31 @@ class WikipediaCrawler:
         
         self.logger.info("Crawler stopped")
     
+    def request_stop(self) -> None:
+        """
+        Ask the crawl loop to stop without waiting for it.
+        
+        Only sets the shutdown flag, so it is safe to call from a signal
+        handler. The loop finishes its current page, saves state and then
+        releases wait_for_completion().
+        """
+        self._shutdown_requested = True
+    
+    def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the crawl loop has finished or the timeout expires.
+        
+        Returns as soon as crawling completes or is stopped, so callers can
+        use this instead of polling get_status() on a fixed sleep.
+        
+        Args:
+            timeout: Maximum time to wait in seconds (None waits indefinitely)
+            
+        Returns:
+            True if crawling has finished, False if the timeout expired
+        """
+        return self._done_event.wait(timeout=timeout)
+    
     def _crawl_loop(self) -> None:
         """Main crawling loop that processes URLs from the queue."""
         try:
@@ -206,48 +243,21 @@ class WikipediaCrawler:
             self.progress_tracker.start_crawling(self.start_url)
             
             # Main processing loop
-            processed_any_url = False
-            consecutive_empty_checks = 0
-            max_empty_checks = 10  # Allow some time for URLs to be added
+            with self._lock:
+                self._active_workers = 0
+                self._processed_any_url = False
             
-            while not self._shutdown_requested:
-                try:
-                    # Get next URL to process
-                    url_item = self.url_queue.get_next_url()
-                    if not url_item:
-                        consecutive_empty_checks += 1
-                        if consecutive_empty_checks >= max_empty_checks and processed_any_url:
-                            # We've processed at least one URL and queue has been empty for a while
-                            self.logger.info("No more URLs to process, finishing crawl")
-                            break
-                        
-                        self.logger.debug(f"No URLs available, waiting... (check {consecutive_empty_checks}/{max_empty_checks})")
-                        time.sleep(0.5)
-                        continue
-                    
-                    # Reset empty check counter since we got a URL
-                    consecutive_empty_checks = 0
-                    processed_any_url = True
-                    
-                    # Check if already processed (double-check for thread safety)
-                    if self.deduplication.is_processed(url_item.url):
-                        self.logger.debug(f"URL already processed: {url_item.url}")
-                        continue
-                    
-                    # Process the URL
-                    self._process_url(url_item)
-                    
-                    # Update progress
-                    self.progress_tracker.update_pending_count(self.url_queue.size())
-                    
-                    # Periodic state saving
-                    if self._session_stats['urls_processed_this_session'] % 10 == 0:
-                        self._save_state()
-                    
-                except Exception as e:
-                    self.logger.error(f"Error in crawl loop: {e}")
-                    self._session_stats['errors_this_session'] += 1
-                    time.sleep(5)  # Brief pause before continuing
+            if self.max_workers == 1:
+                self._process_queue()
+            else:
+                self.logger.info(f"Processing queue with {self.max_workers} workers")
+                with ThreadPoolExecutor(max_workers=self.max_workers,
+                                        thread_name_prefix="WikipediaCrawlerWorker") as executor:
+                    futures = [executor.submit(self._process_queue)
+                               for _ in range(self.max_workers)]
+                    # Re-raise anything a worker did not handle itself
+                    for future in futures:
+                        future.result()
             
             # Crawling completed
             if self._shutdown_requested:
@@ -266,8 +276,78 @@ class WikipediaCrawler:
             with self._lock:
                 self._running = False
             
+            self._done_event.set()
             self.logger.info("Crawl loop finished")
     
+    def _process_queue(self) -> None:
+        """
+        Process URLs from the queue until it is exhausted or shutdown is requested.
+        
+        Runs on the crawl thread, or on each worker thread when max_workers > 1.
+        The queue only counts as exhausted once no other worker is still
+        processing a page that could add new URLs.
+        """
+        consecutive_empty_checks = 0
+        max_empty_checks = 10  # Allow some time for URLs to be added
+        
+        while not self._shutdown_requested:
+            try:
+                # Get next URL to process
+                url_item = self.url_queue.get_next_url()
+                if not url_item:
+                    with self._lock:
+                        other_workers_busy = self._active_workers > 0
+                        processed_any_url = self._processed_any_url
+                    
+                    if other_workers_busy:
+                        consecutive_empty_checks = 0
+                    else:
+                        consecutive_empty_checks += 1
+                    
+                    if consecutive_empty_checks >= max_empty_checks and processed_any_url:
+                        # We've processed at least one URL and queue has been empty for a while
+                        self.logger.info("No more URLs to process, finishing crawl")
+                        break
+                    
+                    self.logger.debug(f"No URLs available, waiting... (check {consecutive_empty_checks}/{max_empty_checks})")
+                    time.sleep(0.5)
+                    continue
+                
+                # Reset empty check counter since we got a URL
+                consecutive_empty_checks = 0
+                with self._lock:
+                    self._processed_any_url = True
+                    self._active_workers += 1
+                
+                try:
+                    # Check if already processed (double-check for thread safety)
+                    if self.deduplication.is_processed(url_item.url):
+                        self.logger.debug(f"URL already processed: {url_item.url}")
+                        continue
+                    
+                    # Process the URL
+                    self._process_url(url_item)
+                    
+                    # Update progress
+                    self.progress_tracker.update_pending_count(self.url_queue.size())
+                    
+                    # Periodic state saving, claimed by exactly one worker
+                    with self._lock:
+                        processed = self._session_stats['urls_processed_this_session']
+                        save_due = processed - self._last_periodic_save >= 10
+                        if save_due:
+                            self._last_periodic_save = processed
+                    if save_due:
+                        self._save_state()
+                finally:
+                    with self._lock:
+                        self._active_workers -= 1
+                
+            except Exception as e:
+                self.logger.error(f"Error in crawl loop: {e}")
+                self._increment_session_stat('errors_this_session')
+                time.sleep(5)  # Brief pause before continuing
+    
     def _process_url(self, url_item: URLItem) -> None:
         """
         Process a single URL.
@@ -296,9 +376,10 @@ class WikipediaCrawler:
             
             # Route to appropriate handler based on page type
             if page_result.page_type == PageType.CATEGORY.value:
-                self._process_category_page(url, page_result.content, url_item.depth)
+                self._process_category_page(url, page_result.content, url_item.depth,
+                                            page_result.parsed_dom)
             elif page_result.page_type == PageType.ARTICLE.value:
-                self._process_article_page(url, page_result.content)
+                self._process_article_page(url, page_result.content, page_result.parsed_dom)
             else:
                 self.logger.warning(f"Unknown page type for URL: {url}")
                 self.progress_tracker.update_progress(
@@ -306,16 +387,27 @@ class WikipediaCrawler:
                     error_message="Unknown page type"
                 )
             
-            self._session_stats['urls_processed_this_session'] += 1
+            self._increment_session_stat('urls_processed_this_session')
             
         except Exception as e:
             self.logger.error(f"Error processing URL {url}: {e}")
             self.progress_tracker.update_progress(
                 url, ProcessStatus.ERROR, url_item.url_type, error_message=str(e)
             )
-            self._session_stats['errors_this_session'] += 1
+            self._increment_session_stat('errors_this_session')
+    
+    def _increment_session_stat(self, key: str) -> None:
+        """
+        Add one to a session counter; workers share these, so it takes the lock.
+        
+        Args:
+            key: Name of the counter in _session_stats
+        """
+        with self._lock:
+            self._session_stats[key] += 1
     
-    def _process_category_page(self, url: str, content: str, depth: int) -> None:
+    def _process_category_page(self, url: str, content: str, depth: int,
+                               dom: Optional[Any] = None) -> None:
         """
         Process a category page.
         
@@ -323,9 +415,10 @@ class WikipediaCrawler:
             url: Category page URL
             content: HTML content
             depth: Current crawling depth
+            dom: Parsed tree of content from PageProcessor, if available
         """
         try:
-            result = self.category_handler.process_category(url, content, depth)
+            result = self.category_handler.process_category(url, content, depth, dom=dom)
             
             if result.success:
                 # Add discovered URLs to queue
@@ -360,16 +453,18 @@ class WikipediaCrawler:
                 url, ProcessStatus.ERROR, URLType.CATEGORY, error_message=str(e)
             )
     
-    def _process_article_page(self, url: str, content: str) -> None:
+    def _process_article_page(self, url: str, content: str,
+                              dom: Optional[Any] = None) -> None:
         """
         Process an article page.
         
         Args:
             url: Article page URL
             content: HTML content
+            dom: Parsed tree of content from PageProcessor, if available
         """
         try:
-            result = self.article_handler.process_article(url, content)
+            result = self.article_handler.process_article(url, content, dom=dom)
             
             if result.success:
                 if result.data and result.data.get('filtered', False):
@@ -429,10 +524,11 @@ class WikipediaCrawler:
         try:
             self.logger.debug("Saving crawler state...")
             
-            # Save component states
-            self.url_queue.save_state()
-            self.deduplication.save_state()
-            self.progress_tracker.save_state()
+            # Save component states (one writer at a time, they share temp file names)
+            with self._state_lock:
+                self.url_queue.save_state()
+                self.deduplication.save_state()
+                self.progress_tracker.save_state()
             
             self.logger.debug("Crawler state saved successfully")
             
@@ -519,7 +615,7 @@ class WikipediaCrawler:
         """Setup signal handlers for graceful shutdown."""
         def signal_handler(signum, frame):
             self.logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-            self.stop_crawling()
+            self.request_stop()
         
         try:
             signal.signal(signal.SIGINT, signal_handler)
@@ -138,6 +138,8 @@ class ProcessResult:
     response_headers: Optional[Dict[str, str]] = None
     discovered_urls: Optional[List[str]] = None
     data: Optional[Dict[str, Any]] = None
+    # Parsed tree of content, reused by page handlers to avoid parsing twice
+    parsed_dom: Optional[Any] = field(default=None, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate process result after initialization."""
@@ -1,15 +1,24 @@
 """Category page handler for processing Wikipedia category pages."""
 
 import re
-from typing import List, Set, Optional
+import threading
+from typing import Dict, List, Set, Optional
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup, Tag
 
 from wikipedia_crawler.models.data_models import CategoryData, ProcessResult
 from wikipedia_crawler.core.file_storage import FileStorage
+from wikipedia_crawler.utils.html_parser import HTML_PARSER
 from wikipedia_crawler.utils.logging_config import get_logger
 
 
+# Plain https://<host>wikipedia.org<host>/wiki/... URLs, accepted without
+# urlparse; anything else falls through to the full check
+_WIKI_URL_RE = re.compile(
+    r'https://[A-Za-z0-9.:@-]*wikipedia\.org[A-Za-z0-9.:@-]*/wiki/'
+)
+
+
 class CategoryPageHandler:
     """
     Handler for processing Wikipedia category pages.
@@ -33,7 +42,8 @@ class CategoryPageHandler:
         self.max_depth = max_depth
         self.logger = get_logger(__name__)
         
-        # Statistics
+        # Statistics (updated by worker threads, so only under _stats_lock)
+        self._stats_lock = threading.Lock()
         self._stats = {
             'categories_processed': 0,
             'subcategories_found': 0,
@@ -43,7 +53,8 @@ class CategoryPageHandler:
         
         self.logger.info(f"CategoryPageHandler initialized with max_depth={max_depth}")
     
-    def process_category(self, url: str, content: str, depth: int = 0) -> ProcessResult:
+    def process_category(self, url: str, content: str, depth: int = 0,
+                         dom: Optional[BeautifulSoup] = None) -> ProcessResult:
         """
         Process a Wikipedia category page.
         
@@ -51,6 +62,8 @@ class CategoryPageHandler:
             url: URL of the category page
             content: HTML content of the page
             depth: Current depth level
+            dom: Already-parsed tree of content, e.g. ProcessResult.parsed_dom
+                (content is parsed here if None)
             
         Returns:
             ProcessResult with extracted links and metadata
@@ -58,8 +71,8 @@ class CategoryPageHandler:
         try:
             self.logger.info(f"Processing category page: {url} (depth: {depth})")
             
-            # Parse HTML content
-            soup = BeautifulSoup(content, 'html.parser')
+            # Parse HTML content unless the caller already did
+            soup = dom if dom is not None else BeautifulSoup(content, HTML_PARSER)
             
             # Extract page title
             title = self._extract_title(soup, url)
@@ -73,9 +86,10 @@ class CategoryPageHandler:
             articles = self._filter_valid_urls(articles)
             
             # Update statistics
-            self._stats['categories_processed'] += 1
-            self._stats['subcategories_found'] += len(subcategories)
-            self._stats['articles_found'] += len(articles)
+            with self._stats_lock:
+                self._stats['categories_processed'] += 1
+                self._stats['subcategories_found'] += len(subcategories)
+                self._stats['articles_found'] += len(articles)
             
             # Create category data
             category_data = CategoryData(
@@ -166,7 +180,8 @@ class CategoryPageHandler:
         Returns:
             List of subcategory URLs
         """
-        subcategories = set()
+        # Keyed by URL so duplicates collapse while page order is kept
+        subcategories: Dict[str, None] = {}
         
         # Method 1: Look for subcategories section
         subcategories_div = soup.find('div', {'id': 'mw-subcategories'})
@@ -177,7 +192,7 @@ class CategoryPageHandler:
                 if href and '/Category:' in href:
                     full_url = self._resolve_url(href, base_url)
                     if full_url:
-                        subcategories.add(full_url)
+                        subcategories[full_url] = None
         
         # Method 2: Look for category tree widget
         category_tree = soup.find('div', class_='CategoryTreeTag')
@@ -188,7 +203,7 @@ class CategoryPageHandler:
                 if href and '/Category:' in href:
                     full_url = self._resolve_url(href, base_url)
                     if full_url:
-                        subcategories.add(full_url)
+                        subcategories[full_url] = None
         
         # Method 3: Look for "Subcategories" heading and following content
         subcategories_heading = soup.find('h2', string=lambda text: 
@@ -203,7 +218,7 @@ class CategoryPageHandler:
                     if href and '/Category:' in href:
                         full_url = self._resolve_url(href, base_url)
                         if full_url:
-                            subcategories.add(full_url)
+                            subcategories[full_url] = None
         
         # Method 4: General search for category links in the main content
         content_div = soup.find('div', {'id': 'mw-content-text'})
@@ -218,7 +233,7 @@ class CategoryPageHandler:
                 if any(indicator in link_text for indicator in ['category', 'categories']):
                     full_url = self._resolve_url(href, base_url)
                     if full_url:
-                        subcategories.add(full_url)
+                        subcategories[full_url] = None
         
         result = list(subcategories)
         self.logger.debug(f"Extracted {len(result)} subcategories from {base_url}")
@@ -235,7 +250,8 @@ class CategoryPageHandler:
         Returns:
             List of article URLs
         """
-        articles = set()
+        # Keyed by URL so duplicates collapse while page order is kept
+        articles: Dict[str, None] = {}
         
         # Method 1: Look for pages section
         pages_div = soup.find('div', {'id': 'mw-pages'})
@@ -246,7 +262,7 @@ class CategoryPageHandler:
                 if href and self._is_article_link(href):
                     full_url = self._resolve_url(href, base_url)
                     if full_url:
-                        articles.add(full_url)
+                        articles[full_url] = None
         
         # Method 2: Look for "Pages in category" heading and following content
         pages_heading = soup.find('h2', string=lambda text: 
@@ -261,7 +277,7 @@ class CategoryPageHandler:
                     if href and self._is_article_link(href):
                         full_url = self._resolve_url(href, base_url)
                         if full_url:
-                            articles.add(full_url)
+                            articles[full_url] = None
         
         # Method 3: Look for category members in lists
         content_div = soup.find('div', {'id': 'mw-content-text'})
@@ -280,7 +296,7 @@ class CategoryPageHandler:
                     if href and self._is_article_link(href):
                         full_url = self._resolve_url(href, base_url)
                         if full_url:
-                            articles.add(full_url)
+                            articles[full_url] = None
         
         # Method 4: Look for category gallery (media files)
         gallery_div = soup.find('div', {'id': 'mw-category-media'})
@@ -291,7 +307,7 @@ class CategoryPageHandler:
                 if href and self._is_article_link(href):
                     full_url = self._resolve_url(href, base_url)
                     if full_url:
-                        articles.add(full_url)
+                        articles[full_url] = None
         
         result = list(articles)
         self.logger.debug(f"Extracted {len(result)} articles from {base_url}")
@@ -374,13 +390,11 @@ class CategoryPageHandler:
         Returns:
             List of valid Wikipedia URLs
         """
-        valid_urls = []
+        valid_urls = [url for url in urls if self._is_valid_wikipedia_url(url)]
         
-        for url in urls:
-            if self._is_valid_wikipedia_url(url):
-                valid_urls.append(url)
-            else:
-                self._stats['invalid_urls_filtered'] += 1
+        if len(valid_urls) < len(urls):
+            with self._stats_lock:
+                self._stats['invalid_urls_filtered'] += len(urls) - len(valid_urls)
         
         return valid_urls
     
@@ -394,6 +408,9 @@ class CategoryPageHandler:
         Returns:
             True if valid, False otherwise
         """
+        if _WIKI_URL_RE.match(url):
+            return True
+        
         try:
             parsed = urlparse(url)
             
@@ -441,14 +458,16 @@ class CategoryPageHandler:
         Returns:
             Dictionary with processing statistics
         """
-        return self._stats.copy()
+        with self._stats_lock:
+            return self._stats.copy()
     
     def reset_stats(self) -> None:
         """Reset processing statistics."""
-        self._stats = {
-            'categories_processed': 0,
-            'subcategories_found': 0,
-            'articles_found': 0,
-            'invalid_urls_filtered': 0
-        }
+        with self._stats_lock:
+            self._stats = {
+                'categories_processed': 0,
+                'subcategories_found': 0,
+                'articles_found': 0,
+                'invalid_urls_filtered': 0
+            }
         self.logger.info("Category handler statistics reset")
\ No newline at end of file
@@ -2,13 +2,150 @@
 
 import re
 import logging
-from typing import Optional, Dict, Any
-from bs4 import BeautifulSoup, Comment, NavigableString
-from markdownify import markdownify as md
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import soupsieve
+from bs4 import BeautifulSoup, Comment, NavigableString, Tag
+from markdownify import MarkdownConverter
 
 from wikipedia_crawler.utils.logging_config import get_logger
 
 
+# Wikipedia-specific patterns to clean, compiled once at import time
+_CLEANUP_FLAGS = re.MULTILINE | re.IGNORECASE
+_CLEANUP_PATTERNS = [
+    # Remove citation markers like [1], [2], [citation needed]
+    (re.compile(r'\[\d+\]', _CLEANUP_FLAGS), ''),
+    (re.compile(r'\[citation needed\]', _CLEANUP_FLAGS), ''),
+    (re.compile(r'\[clarification needed\]', _CLEANUP_FLAGS), ''),
+    (re.compile(r'\[when\?\]', _CLEANUP_FLAGS), ''),
+    (re.compile(r'\[who\?\]', _CLEANUP_FLAGS), ''),
+    (re.compile(r'\[where\?\]', _CLEANUP_FLAGS), ''),
+    # Remove edit links
+    (re.compile(r'\[edit\]', _CLEANUP_FLAGS), ''),
+    # Clean up multiple whitespace
+    (re.compile(r'\s+', _CLEANUP_FLAGS), ' '),
+    # Remove empty lines with just whitespace
+    (re.compile(r'\n\s*\n\s*\n', _CLEANUP_FLAGS), '\n\n'),
+]
+
+# Markdown formatting patterns
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+_WHITESPACE_RE = re.compile(r'\s+')
+_HEADER_NO_SPACE_RE = re.compile(r'^(#+)([^\s])')
+_LIST_ITEM_RE = re.compile(r'^[\-\*\+]\s*[^\s]')
+_LIST_NO_SPACE_RE = re.compile(r'^([\-\*\+])([^\s])')
+_NUMBERED_ITEM_RE = re.compile(r'^\d+\.\s*[^\s]')
+_NUMBERED_NO_SPACE_RE = re.compile(r'^(\d+\.)([^\s])')
+
+# Content statistics patterns
+_STATS_HEADER_RE = re.compile(r'^#+\s', re.MULTILINE)
+_STATS_LIST_RE = re.compile(r'^[\-\*\+\d+\.]\s', re.MULTILINE)
+_STATS_LINK_RE = re.compile(r'\[.*\]\(.*\)')
+
+# Markdown conversion settings shared by every converter instance
+_MARKDOWN_OPTIONS = {
+    'heading_style': 'ATX',  # Use # for headings
+    'bullets': '-',          # Use - for bullet points
+    'convert': ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'br', 
+               'strong', 'b', 'em', 'i', 'u', 'ul', 'ol', 'li',
+               'blockquote', 'code', 'pre', 'a'],
+    'escape_asterisks': False,
+    'escape_underscores': False
+}
+
+# Trailing sections dropped from articles, and links to media pages
+_SKIPPED_SECTION_TITLES = frozenset({'see also', 'references', 'external links', 'further reading'})
+_MEDIA_LINK_PREFIXES = ('/wiki/file:', '/wiki/image:', '/wiki/media:')
+
+# Class fragments marking clutter boxes, by the tag names they appear on
+_WIKIPEDIA_BOX_CLASSES = {
+    'table': ('infobox',),
+    'div': ('navbox', 'reflist'),
+    'section': ('reflist',),
+}
+
+# Removal selectors of the form tag, tag.class, tag#id or link[rel="..."]
+_SIMPLE_SELECTOR_RE = re.compile(
+    r'^([a-z][a-z0-9]*)(?:\.([\w-]+)|#([\w-]+)|\[rel="([^"]+)"\])?$'
+)
+
+# Pages larger than this are cut down to the article body before parsing
+DEFAULT_MAX_FULL_PARSE_SIZE = 256 * 1024
+
+# Stable MediaWiki markers delimiting the article body in a full page
+_CONTENT_START_MARKER = '<div id="mw-content-text"'
+_CONTENT_END_MARKERS = ('<!-- \nNewPP limit report', '<div id="catlinks"')
+
+
+def _is_wikipedia_box(tag) -> bool:
+    """Match infobox tables, navbox divs and reflist divs/sections."""
+    fragments = _WIKIPEDIA_BOX_CLASSES.get(tag.name)
+    if not fragments:
+        return False
+    classes = tag.get('class')
+    if not classes:
+        return False
+    return any(fragment in cls for cls in classes for fragment in fragments)
+
+
+def _compile_removal_matcher(selectors) -> Tuple[Callable[[Tag], bool], List[str]]:
+    """
+    Turn simple removal selectors into a single find_all() predicate.
+    
+    Matching plain tag names, classes, ids and rel values with set lookups
+    is several times faster than running the same selectors through
+    soupsieve, and still needs only one walk of the tree.
+    
+    Args:
+        selectors: CSS selectors naming elements to remove
+        
+    Returns:
+        Tuple of (predicate for the supported selectors, selectors it does not cover)
+    """
+    names = set()
+    classes: Dict[str, set] = {}
+    ids: Dict[str, set] = {}
+    rels: Dict[str, set] = {}
+    unsupported = []
+    
+    for selector in selectors:
+        match = _SIMPLE_SELECTOR_RE.match(selector)
+        if not match:
+            unsupported.append(selector)
+            continue
+        name, class_name, element_id, rel = match.groups()
+        if class_name:
+            classes.setdefault(name, set()).add(class_name)
+        elif element_id:
+            ids.setdefault(name, set()).add(element_id)
+        elif rel:
+            rels.setdefault(name, set()).add(rel)
+        else:
+            names.add(name)
+    
+    def matches(tag: Tag) -> bool:
+        name = tag.name
+        if name in names:
+            return True
+        wanted = classes.get(name)
+        if wanted and not wanted.isdisjoint(tag.get('class') or ()):
+            return True
+        wanted = ids.get(name)
+        if wanted and tag.get('id') in wanted:
+            return True
+        wanted = rels.get(name)
+        if wanted:
+            rel_value = tag.get('rel')
+            if isinstance(rel_value, list):
+                rel_value = ' '.join(rel_value)
+            if rel_value in wanted:
+                return True
+        return False
+    
+    return matches, unsupported
+
+
 class ContentProcessor:
     """
     Processes HTML content and converts it to clean markdown format.
@@ -17,9 +154,16 @@ class ContentProcessor:
     navigation elements, infoboxes, references, and media elements.
     """
     
-    def __init__(self):
-        """Initialize the content processor."""
+    def __init__(self, max_full_parse_size: int = DEFAULT_MAX_FULL_PARSE_SIZE):
+        """
+        Initialize the content processor.
+        
+        Args:
+            max_full_parse_size: HTML larger than this many characters is sliced
+                to the mw-content-text section before parsing
+        """
         self.logger = get_logger(__name__)
+        self.max_full_parse_size = max_full_parse_size
         
         # Elements to remove completely
         self.remove_elements = {
@@ -54,22 +198,24 @@ class ContentProcessor:
             'data-*', 'aria-*', 'role', 'tabindex'
         }
         
-        # Wikipedia-specific patterns to clean
-        self.cleanup_patterns = [
-            # Remove citation markers like [1], [2], [citation needed]
-            (r'\[\d+\]', ''),
-            (r'\[citation needed\]', ''),
-            (r'\[clarification needed\]', ''),
-            (r'\[when\?\]', ''),
-            (r'\[who\?\]', ''),
-            (r'\[where\?\]', ''),
-            # Remove edit links
-            (r'\[edit\]', ''),
-            # Clean up multiple whitespace
-            (r'\s+', ' '),
-            # Remove empty lines with just whitespace
-            (r'\n\s*\n\s*\n', '\n\n'),
-        ]
+        # Wikipedia-specific patterns to clean (precompiled)
+        self.cleanup_patterns = list(_CLEANUP_PATTERNS)
+        
+        # All removal selectors compiled into one predicate, so each page is
+        # matched in a single tree walk instead of one select() per selector;
+        # anything the predicate cannot express still goes through soupsieve
+        self._remove_matcher, unsupported = _compile_removal_matcher(
+            [*self.remove_elements, *self.remove_link_tags]
+        )
+        self._remove_selector = soupsieve.compile(', '.join(unsupported)) if unsupported else None
+        
+        # Per-thread state, since crawler workers share one processor:
+        # - converter: reused across calls so markdownify's per-tag converter
+        #   cache stays warm
+        # - last_processed: (html_content, result) of this thread's latest
+        #   process_content() call, so processing the same page again returns
+        #   without re-parsing it
+        self._local = threading.local()
     
     def process_content(self, html_content: str) -> str:
         """
@@ -87,71 +233,127 @@ class ContentProcessor:
         if not html_content or not html_content.strip():
             return ""
         
+        last_processed = getattr(self._local, 'last_processed', None)
+        if last_processed is not None and last_processed[0] == html_content:
+            return last_processed[1]
+        
         try:
-            # Parse HTML
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Remove unwanted elements
-            self._remove_unwanted_elements(soup)
+            # Parse HTML, skipping page chrome on full-size pages
+            soup = BeautifulSoup(self._slice_main_content(html_content), 'html.parser')
             
-            # Clean up attributes
-            self._clean_attributes(soup)
+            final_content = self._process_parsed(soup)
             
-            # Extract main content
-            main_content = self._extract_main_content(soup)
+            self.logger.debug(f"Processed content: {len(html_content)} -> {len(final_content)} characters")
+            self._local.last_processed = (html_content, final_content)
+            return final_content
             
-            # Convert to markdown
-            markdown_content = self._convert_to_markdown(main_content)
+        except Exception as e:
+            self.logger.error(f"Failed to process content: {e}")
+            raise ValueError(f"Content processing failed: {e}") from e
+    
+    def process_soup(self, soup: BeautifulSoup) -> str:
+        """
+        Process an already-parsed HTML tree and convert to clean markdown.
+        
+        Use this instead of process_content() when the caller already holds
+        a BeautifulSoup tree, to avoid serializing it and parsing it again.
+        The tree is modified in place.
+        
+        Args:
+            soup: Parsed BeautifulSoup tree (or element) to process
             
-            # Apply cleanup patterns
-            cleaned_content = self._apply_cleanup_patterns(markdown_content)
+        Returns:
+            Clean markdown formatted content
             
-            # Final formatting
-            final_content = self._final_formatting(cleaned_content)
+        Raises:
+            ValueError: If content cannot be processed
+        """
+        if soup is None:
+            return ""
+        
+        try:
+            final_content = self._process_parsed(soup)
             
-            self.logger.debug(f"Processed content: {len(html_content)} -> {len(final_content)} characters")
+            self.logger.debug(f"Processed parsed content -> {len(final_content)} characters")
             return final_content
             
         except Exception as e:
             self.logger.error(f"Failed to process content: {e}")
             raise ValueError(f"Content processing failed: {e}") from e
     
+    def _slice_main_content(self, html_content: str) -> str:
+        """
+        Cut a full Wikipedia page down to its mw-content-text section.
+        
+        Scripts, styles, navigation and sidebars outside the article body make
+        up most of a full page, so slicing on the raw string keeps them out of
+        the parse entirely. Small inputs and pages without the MediaWiki
+        markers are returned unchanged.
+        """
+        if len(html_content) <= self.max_full_parse_size:
+            return html_content
+        
+        start = html_content.find(_CONTENT_START_MARKER)
+        if start == -1:
+            return html_content
+        
+        for marker in _CONTENT_END_MARKERS:
+            end = html_content.rfind(marker, start)
+            if end != -1:
+                self.logger.debug(f"Sliced HTML to main content: {len(html_content)} -> {end - start} characters")
+                return html_content[start:end]
+        
+        return html_content
+    
+    def _process_parsed(self, soup: BeautifulSoup) -> str:
+        """Run the cleaning and conversion pipeline on a parsed tree."""
+        # Remove unwanted elements
+        self._remove_unwanted_elements(soup)
+        
+        # Clean up attributes
+        self._clean_attributes(soup)
+        
+        # Extract main content
+        main_content = self._extract_main_content(soup)
+        
+        # Convert to markdown
+        markdown_content = self._convert_to_markdown(main_content)
+        
+        # Apply cleanup patterns
+        cleaned_content = self._apply_cleanup_patterns(markdown_content)
+        
+        # Final formatting
+        return self._final_formatting(cleaned_content)
+    
     def _remove_unwanted_elements(self, soup: BeautifulSoup) -> None:
         """Remove unwanted HTML elements from the soup."""
         # Remove comments
         for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
             comment.extract()
         
-        # Remove elements by tag and class
-        for selector in self.remove_elements:
-            for element in soup.select(selector):
-                element.decompose()
-        
-        # Remove HTML link tags (stylesheets, etc.) separately to avoid removing content links
-        for selector in self.remove_link_tags:
-            for element in soup.select(selector):
+        # Remove elements by tag and class, plus HTML link tags (stylesheets,
+        # etc.) matched by rel so that content links are kept
+        for element in soup.find_all(self._remove_matcher):
+            if not element.decomposed:
                 element.decompose()
+        if self._remove_selector is not None:
+            for element in self._remove_selector.select(soup):
+                if not element.decomposed:
+                    element.decompose()
         
         # Remove specific Wikipedia elements
         self._remove_wikipedia_specific_elements(soup)
     
     def _remove_wikipedia_specific_elements(self, soup: BeautifulSoup) -> None:
         """Remove Wikipedia-specific elements that clutter content."""
-        # Remove infoboxes
-        for infobox in soup.find_all('table', class_=lambda x: x and 'infobox' in x):
-            infobox.decompose()
-        
-        # Remove navigation boxes
-        for navbox in soup.find_all('div', class_=lambda x: x and 'navbox' in x):
-            navbox.decompose()
-        
-        # Remove reference sections
-        for ref_section in soup.find_all(['div', 'section'], class_=lambda x: x and 'reflist' in x):
-            ref_section.decompose()
+        # Remove infoboxes, navigation boxes and reference sections in one walk
+        for box in soup.find_all(_is_wikipedia_box):
+            if not box.decomposed:
+                box.decompose()
         
         # Remove "See also" and similar sections (often not useful for content)
         for heading in soup.find_all(['h2', 'h3', 'h4']):
-            if heading.get_text().strip().lower() in ['see also', 'references', 'external links', 'further reading']:
+            if heading.get_text().strip().lower() in _SKIPPED_SECTION_TITLES:
                 # Remove the heading and everything until the next heading of same or higher level
                 current = heading
                 while current and current.next_sibling:
@@ -165,15 +367,16 @@ class ContentProcessor:
                         current = next_elem
                 heading.decompose()
         
-        # Remove image and media elements
-        for img in soup.find_all(['img', 'figure', 'audio', 'video']):
-            img.decompose()
-        
-        # Remove file links (File:, Image:, Media:)
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '')
-            if any(prefix in href.lower() for prefix in ['/wiki/file:', '/wiki/image:', '/wiki/media:']):
-                link.decompose()
+        # Remove image and media elements and file links (File:, Image:,
+        # Media:) in one walk; links inside removed media are already gone
+        for element in soup.find_all(['img', 'figure', 'audio', 'video', 'a']):
+            if element.decomposed:
+                continue
+            if element.name == 'a':
+                href_lower = element.get('href', '').lower()
+                if not any(prefix in href_lower for prefix in _MEDIA_LINK_PREFIXES):
+                    continue
+            element.decompose()
     
     def _clean_attributes(self, soup: BeautifulSoup) -> None:
         """Remove unwanted attributes from HTML elements."""
@@ -197,44 +400,61 @@ class ContentProcessor:
     
     def _extract_main_content(self, soup: BeautifulSoup) -> BeautifulSoup:
         """Extract the main content area from Wikipedia page."""
-        # Try to find the main content div - check multiple selectors in order of preference
+        # Collect every candidate content div in a single walk of the tree
+        # instead of running a separate find() for each selector
+        content_container = None
+        content_texts = []
+        parser_output = None
+        body_content = None
+        
+        for div in soup.find_all('div'):
+            classes = div.get('class') or ()
+            div_id = div.get('id')
+            
+            if content_container is None and 'mw-content-container' in classes:
+                content_container = div
+            if parser_output is None and 'mw-parser-output' in classes:
+                parser_output = div
+            if div_id == 'mw-content-text':
+                content_texts.append(div)
+            elif body_content is None and div_id == 'bodyContent':
+                body_content = div
+        
+        # Check candidates in order of preference
         # Prioritize newer structure first as it contains more complete content
         
         # First try the newer mw-content-container structure (preferred)
-        content_container = soup.find('div', class_='mw-content-container')
         if content_container:
             # Look for mw-content-text within the container
             mw_content_text = content_container.find('div', {'id': 'mw-content-text'})
             if mw_content_text:
                 # Look for mw-parser-output within it
-                parser_output = mw_content_text.find('div', class_='mw-parser-output')
-                if parser_output:
-                    return parser_output
+                nested_output = mw_content_text.find('div', class_='mw-parser-output')
+                if nested_output:
+                    return nested_output
                 return mw_content_text
             # Fallback to the container itself
             return content_container
         
         # Try the traditional mw-content-text structure (alternative)
         # Only look for mw-content-text that is NOT inside mw-content-container
-        for mw_content_text in soup.find_all('div', {'id': 'mw-content-text'}):
+        for mw_content_text in content_texts:
             # Check if this mw-content-text is inside a mw-content-container
             parent_container = mw_content_text.find_parent('div', class_='mw-content-container')
             if not parent_container:  # Only use if not inside container
                 # Look for mw-parser-output within it
-                parser_output = mw_content_text.find('div', class_='mw-parser-output')
-                if parser_output:
-                    return parser_output
+                nested_output = mw_content_text.find('div', class_='mw-parser-output')
+                if nested_output:
+                    return nested_output
                 return mw_content_text
         
         # Try direct mw-parser-output as alternative
-        main_content = soup.find('div', class_='mw-parser-output')
-        if main_content:
-            return main_content
+        if parser_output:
+            return parser_output
         
         # Try bodyContent as fallback alternative
-        main_content = soup.find('div', {'id': 'bodyContent'})
-        if main_content:
-            return main_content
+        if body_content:
+            return body_content
         
         # Final fallback to the entire body or soup
         main_content = soup.find('body') or soup
@@ -242,32 +462,36 @@ class ContentProcessor:
     
     def _convert_to_markdown(self, soup: BeautifulSoup) -> str:
         """Convert cleaned HTML to markdown."""
-        # Configure markdownify options
-        markdown_options = {
-            'heading_style': 'ATX',  # Use # for headings
-            'bullets': '-',          # Use - for bullet points
-            'convert': ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'br', 
-                       'strong', 'b', 'em', 'i', 'u', 'ul', 'ol', 'li',
-                       'blockquote', 'code', 'pre', 'a'],
-            'escape_asterisks': False,
-            'escape_underscores': False
-        }
-        
-        # Convert to markdown
-        html_str = str(soup)
-        markdown = md(html_str, **markdown_options)
+        # Convert the parsed tree directly; serializing it with str() and
+        # letting markdownify parse it again would hold a second copy of the page
+        markdown = self._get_markdown_converter().convert_soup(soup)
         
         return markdown
     
+    def _get_markdown_converter(self) -> MarkdownConverter:
+        """Return the calling thread's markdown converter, creating it on first use."""
+        converter = getattr(self._local, 'converter', None)
+        if converter is None:
+            converter = self._local.converter = MarkdownConverter(**_MARKDOWN_OPTIONS)
+        return converter
+    
     def _apply_cleanup_patterns(self, content: str) -> str:
         """Apply regex cleanup patterns to the content."""
         for pattern, replacement in self.cleanup_patterns:
-            content = re.sub(pattern, replacement, content, flags=re.MULTILINE | re.IGNORECASE)
+            content = pattern.sub(replacement, content)
         
         return content
     
     def _final_formatting(self, content: str) -> str:
         """Apply final formatting and cleanup."""
+        # The default cleanup patterns collapse all whitespace, newlines
+        # included, so content normally arrives here as a single line
+        if '\n' not in content:
+            line = content.strip()
+            if not line:
+                return ''
+            return self._fix_markdown_formatting(line).rstrip() + '\n'
+        
         lines = content.split('\n')
         cleaned_lines = []
         
@@ -291,7 +515,7 @@ class ContentProcessor:
         result = '\n'.join(cleaned_lines)
         
         # Remove excessive newlines (more than 2 consecutive)
-        result = re.sub(r'\n{3,}', '\n\n', result)
+        result = _EXCESS_NEWLINES_RE.sub('\n\n', result)
         
         # Ensure content ends with single newline
         result = result.rstrip() + '\n' if result.strip() else ''
@@ -303,20 +527,20 @@ class ContentProcessor:
         # Fix spacing around headers
         if line.startswith('#'):
             # Ensure space after #
-            line = re.sub(r'^(#+)([^\s])', r'\1 \2', line)
+            line = _HEADER_NO_SPACE_RE.sub(r'\1 \2', line)
         
         # Fix list formatting
-        if re.match(r'^[\-\*\+]\s*[^\s]', line):
+        if _LIST_ITEM_RE.match(line):
             # Ensure space after list marker
-            line = re.sub(r'^([\-\*\+])([^\s])', r'\1 \2', line)
+            line = _LIST_NO_SPACE_RE.sub(r'\1 \2', line)
         
         # Fix numbered list formatting
-        if re.match(r'^\d+\.\s*[^\s]', line):
+        if _NUMBERED_ITEM_RE.match(line):
             # Ensure space after number
-            line = re.sub(r'^(\d+\.)([^\s])', r'\1 \2', line)
+            line = _NUMBERED_NO_SPACE_RE.sub(r'\1 \2', line)
         
         # Clean up excessive spaces
-        line = re.sub(r'\s+', ' ', line)
+        line = _WHITESPACE_RE.sub(' ', line)
         
         return line
     
@@ -337,7 +561,7 @@ class ContentProcessor:
             'compression_ratio': len(processed_markdown) / len(original_html) if original_html else 0,
             'original_lines': original_html.count('\n') + 1 if original_html else 0,
             'processed_lines': processed_markdown.count('\n') + 1 if processed_markdown else 0,
-            'has_headers': bool(re.search(r'^#+\s', processed_markdown, re.MULTILINE)),
-            'has_lists': bool(re.search(r'^[\-\*\+\d+\.]\s', processed_markdown, re.MULTILINE)),
-            'has_links': bool(re.search(r'\[.*\]\(.*\)', processed_markdown))
+            'has_headers': bool(_STATS_HEADER_RE.search(processed_markdown)),
+            'has_lists': bool(_STATS_LIST_RE.search(processed_markdown)),
+            'has_links': bool(_STATS_LINK_RE.search(processed_markdown))
         }
\ No newline at end of file
@@ -1,13 +1,16 @@
 """Language detection and filtering for Wikipedia content."""
 
+import hashlib
 import re
 import logging
+import threading
 from typing import Dict, Set, Optional, Tuple
 from collections import defaultdict
 from urllib.parse import urlparse
 
 try:
     from langdetect import detect, detect_langs, DetectorFactory
+    from langdetect.detector_factory import init_factory
     from langdetect.lang_detect_exception import LangDetectException
     LANGDETECT_AVAILABLE = True
 except ImportError:
@@ -16,6 +19,10 @@ except ImportError:
 from wikipedia_crawler.utils.logging_config import get_logger
 
 
+# Upper bound on remembered content-based detection results per filter
+CONTENT_LANGUAGE_CACHE_SIZE = 1024
+
+
 class LanguageFilter:
     """
     Detects and filters content based on language.
@@ -40,10 +47,21 @@ class LanguageFilter:
         self.supported_languages = supported_languages
         self.language_stats = defaultdict(int)
         
+        # Content-based detection results keyed by a digest of the content,
+        # so the same text is only run through langdetect once
+        self._content_language_cache: Dict[bytes, str] = {}
+        
+        # Worker threads share one filter, so language_stats and the cache
+        # are only touched under this lock
+        self._lock = threading.Lock()
+        
         # Initialize langdetect if available
         if LANGDETECT_AVAILABLE:
             # Set seed for consistent results
             DetectorFactory.seed = 0
+            # Load the language profiles now: langdetect loads them lazily on
+            # first use, which is not safe when workers detect concurrently
+            init_factory()
             self.logger.debug("Language detection library initialized")
         else:
             self.logger.warning("langdetect library not available, using fallback methods")
@@ -83,22 +101,48 @@ class LanguageFilter:
                 self.logger.debug(f"Language detected from URL: {url_language}")
                 return url_language
             
-            # Method 2: Content-based detection using langdetect
-            if LANGDETECT_AVAILABLE:
-                langdetect_result = self._detect_language_with_langdetect(content)
-                if langdetect_result and langdetect_result != 'unknown':
-                    self.logger.debug(f"Language detected with langdetect: {langdetect_result}")
-                    return langdetect_result
-            
-            # Method 3: Pattern-based detection (fallback)
-            pattern_result = self._detect_language_with_patterns(content)
-            self.logger.debug(f"Language detected with patterns: {pattern_result}")
-            return pattern_result
+            # Methods 2 and 3: Content-based detection, remembered per content
+            return self._detect_language_from_content(content)
             
         except Exception as e:
             self.logger.error(f"Language detection failed: {e}")
             return 'unknown'
     
+    def _detect_language_from_content(self, content: str) -> str:
+        """
+        Detect language from the text alone, reusing earlier results.
+        
+        Args:
+            content: Text content to analyze
+            
+        Returns:
+            Detected language code (e.g., 'en', 'zh', 'unknown')
+        """
+        key = hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+        with self._lock:
+            cached = self._content_language_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        # Method 2: Content-based detection using langdetect
+        result = None
+        if LANGDETECT_AVAILABLE:
+            langdetect_result = self._detect_language_with_langdetect(content)
+            if langdetect_result and langdetect_result != 'unknown':
+                self.logger.debug(f"Language detected with langdetect: {langdetect_result}")
+                result = langdetect_result
+        
+        # Method 3: Pattern-based detection (fallback)
+        if result is None:
+            result = self._detect_language_with_patterns(content)
+            self.logger.debug(f"Language detected with patterns: {result}")
+        
+        with self._lock:
+            if len(self._content_language_cache) >= CONTENT_LANGUAGE_CACHE_SIZE:
+                self._content_language_cache.clear()
+            self._content_language_cache[key] = result
+        return result
+    
     def is_supported_language(self, language: str) -> bool:
         """
         Check if a language is supported.
@@ -127,7 +171,8 @@ class LanguageFilter:
         detected_language = self.detect_language(content, url)
         
         # Update statistics
-        self.language_stats[detected_language] += 1
+        with self._lock:
+            self.language_stats[detected_language] += 1
         
         # Check if language is supported
         should_process = self.is_supported_language(detected_language)
@@ -156,11 +201,13 @@ class LanguageFilter:
         Returns:
             Dictionary mapping language codes to counts
         """
-        return dict(self.language_stats)
+        with self._lock:
+            return dict(self.language_stats)
     
     def reset_stats(self) -> None:
         """Reset language statistics."""
-        self.language_stats.clear()
+        with self._lock:
+            self.language_stats.clear()
     
     def _detect_language_from_url(self, url: str) -> str:
         """Detect language from Wikipedia URL domain."""
@@ -6,11 +6,18 @@ from .filename_utils import (
     create_unique_filename
 )
 from .logging_config import setup_logging, get_logger
+from .http_client import create_session, get_session
+from .html_parser import HTML_PARSER
+from .html_cache import fetch_html_cached
 
 __all__ = [
     'sanitize_filename',
     'sanitize_wikipedia_title', 
     'create_unique_filename',
     'setup_logging',
-    'get_logger'
+    'get_logger',
+    'create_session',
+    'get_session',
+    'HTML_PARSER',
+    'fetch_html_cached'
 ]
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""Local on-disk cache for pages fetched by debug scripts and tests."""
+
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from .http_client import get_session
+
+
+# Fetched pages are cached here; WIKI_TEST_CACHE=0 disables it
+HTML_CACHE_DIR = Path(tempfile.gettempdir()) / "wiki_test_cache"
+HTML_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # One week, in seconds
+USER_AGENT = 'Mozilla/5.0 (compatible; WikipediaCrawler/1.0; Educational Research)'
+
+
+def fetch_html_cached(url: str, max_age: float = HTML_CACHE_MAX_AGE) -> str:
+    """
+    Fetch page HTML, reusing a local copy saved by an earlier run.
+
+    Copies are keyed by a hash of the URL and refetched once older than
+    max_age. Set WIKI_TEST_CACHE=0 to always fetch and never write the cache.
+
+    Args:
+        url: Page URL to fetch
+        max_age: Maximum age of a cached copy in seconds
+
+    Returns:
+        HTML content of the page
+    """
+    use_cache = os.environ.get('WIKI_TEST_CACHE', '1') != '0'
+    cache_path = HTML_CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.html"
+
+    if use_cache:
+        try:
+            if time.time() - cache_path.stat().st_mtime < max_age:
+                return cache_path.read_text(encoding='utf-8')
+        except OSError:
+            pass  # Not cached yet
+
+    response = get_session().get(url, headers={'User-Agent': USER_AGENT}, timeout=30)
+    response.raise_for_status()
+
+    if use_cache:
+        HTML_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(response.text, encoding='utf-8')
+
+    return response.text
@@ -0,0 +1,10 @@
+"""HTML parser selection shared by the page handlers."""
+
+# lxml's C parser is several times faster than the pure-Python html.parser;
+# use it whenever it is installed and fall back otherwise
+try:
+    import lxml  # noqa: F401
+except ImportError:
+    HTML_PARSER = 'html.parser'
+else:
+    HTML_PARSER = 'lxml'
@@ -0,0 +1,63 @@
+"""Shared HTTP session utilities for the Wikipedia crawler."""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# Connection pool sizing for Wikipedia hosts
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 50
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def create_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+) -> requests.Session:
+    """
+    Create a requests session with a pooled, keep-alive HTTPS adapter.
+    
+    Retries are left to the caller (max_retries=0) so that the crawler's
+    own retry and backoff logic stays in control.
+    
+    Args:
+        pool_connections: Number of host connection pools to cache
+        pool_maxsize: Maximum connections kept alive per host
+    
+    Returns:
+        Configured requests.Session instance
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=0,
+        pool_block=False
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Connection'] = 'keep-alive'
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide shared session, creating it on first use.
+    
+    Reusing one session keeps TCP/TLS connections to en.wikipedia.org
+    open between requests instead of handshaking for every fetch.
+    
+    Returns:
+        Shared requests.Session instance
+    """
+    global _shared_session
+    
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session()
+        return _shared_session